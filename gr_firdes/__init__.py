@@ -1 +1,2 @@
 from . import firdes
+from . import cache
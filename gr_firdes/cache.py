@@ -0,0 +1,130 @@
+"""
+Memoized Finite Impulse Response (FIR) filter design.
+
+Same design functions as gr_firdes.firdes, but the taps of each filter spec are kept in a bounded LRU cache,
+and optionally in a persistent on-disk store that is shared across processes (see set_cache_dir()).
+
+The returned numpy.array() of taps is read-only, since it is shared between all callers.
+"""
+
+import os
+import hashlib
+import tempfile
+import warnings
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from . import firdes
+from .firdes import WinType
+
+
+CACHE_SIZE = 128  #: max. number of filter designs kept in memory
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_cache_dir = None
+
+
+def set_cache_dir(cache_dir):
+    """
+    Enable the persistent on-disk store of filter designs.
+
+    :param cache_dir  directory for the .npy files (created if necessary), or None to disable the store.
+                      Defaults to the GR_FIRDES_CACHE_DIR environment variable.
+    """
+    global _cache_dir
+    if cache_dir is not None and not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            if not os.path.isdir(cache_dir):  # else created concurrently by another process
+                raise
+    _cache_dir = cache_dir
+
+
+def clear_cache():
+    """Forget the filter designs kept in memory (the on-disk store is left alone)."""
+    with _lock:
+        _cache.clear()
+
+
+def _disk_filename(key):
+    return os.path.join(_cache_dir, '{}_{}.npy'.format(key[0], hashlib.sha1(repr(key).encode('ascii')).hexdigest()[:16]))
+
+
+def _disk_load(key):
+    try:
+        return np.load(_disk_filename(key))
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _disk_store(key, taps):
+    # write to a temporary file and rename it, so concurrent processes never see a partial file.
+    # Failures are ignored: the design is still returned (and kept in memory).
+    tmp_name = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(suffix='.npy', dir=_cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, taps)
+        os.rename(tmp_name, _disk_filename(key))
+    except (IOError, OSError):
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def _design(func, *args):
+    """:returns taps designed by `func(*args)`, memoized by the function name and its (numeric) arguments"""
+    key = (func.__name__,) + tuple(float(a) for a in args)
+    with _lock:
+        taps = _cache.pop(key, None)
+        if taps is not None:
+            _cache[key] = taps  # re-insert as most recently used
+            return taps
+
+    if _cache_dir is not None:
+        taps = _disk_load(key)
+    if taps is None:
+        taps = func(*args)
+        if _cache_dir is not None:
+            _disk_store(key, taps)
+    taps.setflags(write=False)
+
+    with _lock:
+        while len(_cache) >= CACHE_SIZE:
+            _cache.popitem(last=False)
+        _cache[key] = taps
+    return taps
+
+
+def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+    """Memoized gr_firdes.firdes.high_pass_2()"""
+    return _design(firdes.high_pass_2, gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+
+
+def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+    """Memoized gr_firdes.firdes.low_pass_2()"""
+    return _design(firdes.low_pass_2, gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+
+
+def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+    """Memoized gr_firdes.firdes.band_pass_2()"""
+    return _design(firdes.band_pass_2, gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+
+
+def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+    """Memoized gr_firdes.firdes.band_reject_2()"""
+    return _design(firdes.band_reject_2, gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+
+
+def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):
+    """Memoized gr_firdes.firdes.hilbert()"""
+    return _design(firdes.hilbert, ntaps, window, beta)
+
+
+try:
+    set_cache_dir(os.environ.get('GR_FIRDES_CACHE_DIR'))
+except OSError as e:
+    warnings.warn('gr_firdes.cache: on-disk store disabled, cannot create GR_FIRDES_CACHE_DIR: {}'.format(e))
@@ -479,7 +479,7 @@ static const char *__pyx_f[] = {
 /*--- Type declarations ---*/
 struct __pyx_obj_9gr_firdes_6firdes_WinType;
 
-/* "gr_firdes/firdes.pyx":17
+/* "gr_firdes/firdes.pyx":20
  * 
  * 
  * cdef class WinType:             # <<<<<<<<<<<<<<
@@ -563,6 +563,10 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
     PyTypeObject* tp = Py_TYPE(obj);
@@ -607,16 +611,53 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(PyObject *);
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
 static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *);
 
+#ifndef __Pyx_CppExn2PyErr
+#include <new>
+#include <typeinfo>
+#include <stdexcept>
+#include <ios>
+static void __Pyx_CppExn2PyErr() {
+  try {
+    if (PyErr_Occurred())
+      ; // let the latest Python exn pass through and ignore the current one
+    else
+      throw;
+  } catch (const std::bad_alloc& exn) {
+    PyErr_SetString(PyExc_MemoryError, exn.what());
+  } catch (const std::bad_cast& exn) {
+    PyErr_SetString(PyExc_TypeError, exn.what());
+  } catch (const std::domain_error& exn) {
+    PyErr_SetString(PyExc_ValueError, exn.what());
+  } catch (const std::invalid_argument& exn) {
+    PyErr_SetString(PyExc_ValueError, exn.what());
+  } catch (const std::ios_base::failure& exn) {
+    PyErr_SetString(PyExc_IOError, exn.what());
+  } catch (const std::out_of_range& exn) {
+    PyErr_SetString(PyExc_IndexError, exn.what());
+  } catch (const std::overflow_error& exn) {
+    PyErr_SetString(PyExc_OverflowError, exn.what());
+  } catch (const std::range_error& exn) {
+    PyErr_SetString(PyExc_ArithmeticError, exn.what());
+  } catch (const std::underflow_error& exn) {
+    PyErr_SetString(PyExc_ArithmeticError, exn.what());
+  } catch (const std::exception& exn) {
+    PyErr_SetString(PyExc_RuntimeError, exn.what());
+  }
+  catch (...)
+  {
+    PyErr_SetString(PyExc_RuntimeError, "Unknown exception");
+  }
+}
+#endif
+
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
-
 static int __Pyx_check_binary_version(void);
 
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(enum gr::filter::firdes::win_type value);
@@ -660,7 +701,7 @@ static char __pyx_k_high_cutoff_freq[] = "high_cutoff_freq";
 static char __pyx_k_transition_width[] = "transition_width";
 static char __pyx_k_WIN_BLACKMAN_HARRIS[] = "WIN_BLACKMAN_HARRIS";
 static char __pyx_k_WIN_BLACKMAN_hARRIS[] = "WIN_BLACKMAN_hARRIS";
-static char __pyx_k_Finite_Impulse_Response_FIR_fil[] = "\nFinite Impulse Response (FIR) filter design functions.\n\nsee http://gnuradio.org/doc/doxygen/classgr_1_1filter_1_1firdes.html\n";
+static char __pyx_k_Finite_Impulse_Response_FIR_fil[] = "\nFinite Impulse Response (FIR) filter design functions.\n\nsee http://gnuradio.org/doc/doxygen/classgr_1_1filter_1_1firdes.html\n\nThe designs run without holding the GIL, so several threads can design filters in parallel.\n";
 static PyObject *__pyx_n_s_WIN_BARTLETT;
 static PyObject *__pyx_n_s_WIN_BLACKMAN;
 static PyObject *__pyx_n_s_WIN_BLACKMAN_HARRIS;
@@ -689,13 +730,12 @@ static PyObject *__pyx_n_s_sampling_freq;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_transition_width;
 static PyObject *__pyx_n_s_window;
-static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta); /* proto */
-static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta); /* proto */
-static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_low_cutoff_freq, PyObject *__pyx_v_high_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta); /* proto */
-static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_low_cutoff_freq, PyObject *__pyx_v_high_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta); /* proto */
-static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ntaps, PyObject *__pyx_v_window, PyObject *__pyx_v_beta); /* proto */
+static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta); /* proto */
+static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta); /* proto */
+static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_low_cutoff_freq, double __pyx_v_high_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta); /* proto */
+static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_low_cutoff_freq, double __pyx_v_high_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta); /* proto */
+static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__pyx_self, unsigned int __pyx_v_ntaps, int __pyx_v_window, double __pyx_v_beta); /* proto */
 static PyObject *__pyx_tp_new_9gr_firdes_6firdes_WinType(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_float_6_76;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
@@ -705,16 +745,16 @@ static PyObject *__pyx_int_5;
 static PyObject *__pyx_int_6;
 static PyObject *__pyx_int_7;
 static PyObject *__pyx_int_neg_1;
-static PyObject *__pyx_k_;
-static PyObject *__pyx_k__2;
-static PyObject *__pyx_k__3;
-static PyObject *__pyx_k__4;
-static PyObject *__pyx_k__5;
+static int __pyx_k_;
+static int __pyx_k__2;
+static int __pyx_k__3;
+static int __pyx_k__4;
+static int __pyx_k__5;
 
-/* "gr_firdes/firdes.pyx":30
+/* "gr_firdes/firdes.pyx":33
  * 
  * 
- * def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a high-pass FIR filter.  The
  */
@@ -723,13 +763,13 @@ static PyObject *__pyx_k__5;
 static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_9gr_firdes_6firdes_high_pass_2[] = "\n    Use \"window method\" to design a high-pass FIR filter.  The\n    normalized width of the transition band and the required stop band\n    attenuation is what sets the number of taps required.  Narrow --> more\n    taps More attenuation --> more taps. The window type determines\n    maximum attentuation and passband ripple.\n\n    :param gain                overall gain of filter (typically 1.0)\n    :param sampling_freq       sampling freq (Hz)\n    :param cutoff_freq         beginning of transition band (Hz)\n    :param transition_width    width of transition band (Hz)\n    :param attenuation_dB      required stopband attenuation (dB)\n    :param window              one of firdes::win_type\n    :param beta\t\t           parameter for Kaiser window\n\n    :return a numpy.array() of filter taps (aka h[x], aka impulse response)\n    ";
 static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_gain = 0;
-  PyObject *__pyx_v_sampling_freq = 0;
-  PyObject *__pyx_v_cutoff_freq = 0;
-  PyObject *__pyx_v_transition_width = 0;
-  PyObject *__pyx_v_attenuation_dB = 0;
-  PyObject *__pyx_v_window = 0;
-  PyObject *__pyx_v_beta = 0;
+  double __pyx_v_gain;
+  double __pyx_v_sampling_freq;
+  double __pyx_v_cutoff_freq;
+  double __pyx_v_transition_width;
+  double __pyx_v_attenuation_dB;
+  int __pyx_v_window;
+  double __pyx_v_beta;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -739,8 +779,6 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self,
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_gain,&__pyx_n_s_sampling_freq,&__pyx_n_s_cutoff_freq,&__pyx_n_s_transition_width,&__pyx_n_s_attenuation_dB,&__pyx_n_s_window,&__pyx_n_s_beta,0};
     PyObject* values[7] = {0,0,0,0,0,0,0};
-    values[5] = __pyx_k_;
-    values[6] = ((PyObject *)__pyx_float_6_76);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -763,22 +801,22 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self,
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sampling_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_transition_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_attenuation_dB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (kw_args > 0) {
@@ -792,7 +830,7 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self,
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "high_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "high_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -807,17 +845,25 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self,
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_gain = values[0];
-    __pyx_v_sampling_freq = values[1];
-    __pyx_v_cutoff_freq = values[2];
-    __pyx_v_transition_width = values[3];
-    __pyx_v_attenuation_dB = values[4];
-    __pyx_v_window = values[5];
-    __pyx_v_beta = values[6];
+    __pyx_v_gain = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_gain == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sampling_freq = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_sampling_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_cutoff_freq = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_transition_width = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_transition_width == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_attenuation_dB = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_attenuation_dB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[5]) {
+      __pyx_v_window = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_window == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_window = __pyx_k_;
+    }
+    if (values[6]) {
+      __pyx_v_beta = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_beta = ((double)6.76);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("high_pass_2", 0, 5, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("gr_firdes.firdes.high_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -830,57 +876,95 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_1high_pass_2(PyObject *__pyx_self,
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta) {
+static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta) {
   std::vector<float>  __pyx_v_c_taps;
   char *__pyx_v_c_str;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_np_taps = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
-  double __pyx_t_2;
-  double __pyx_t_3;
-  double __pyx_t_4;
-  double __pyx_t_5;
-  enum gr::filter::firdes::win_type __pyx_t_6;
-  double __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
+  std::vector<float>  __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("high_pass_2", 0);
 
-  /* "gr_firdes/firdes.pyx":48
- *     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
+  /* "gr_firdes/firdes.pyx":52
  *     """
- *     cdef vector[float] c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)             # <<<<<<<<<<<<<<
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "gr_firdes/firdes.pyx":53
+ *     cdef vector[float] c_taps
+ *     with nogil:
+ *         c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)             # <<<<<<<<<<<<<<
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_gain); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_v_sampling_freq); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_v_cutoff_freq); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_transition_width); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_attenuation_dB); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = ((enum gr::filter::firdes::win_type)__Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(__pyx_v_window)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_v_beta); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_c_taps = gr::filter::firdes::high_pass_2(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7);
-
-  /* "gr_firdes/firdes.pyx":49
+        try {
+          __pyx_t_1 = gr::filter::firdes::high_pass_2(__pyx_v_gain, __pyx_v_sampling_freq, __pyx_v_cutoff_freq, __pyx_v_transition_width, __pyx_v_attenuation_dB, ((enum gr::filter::firdes::win_type)__pyx_v_window), __pyx_v_beta);
+        } catch(...) {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+          #endif
+          __Pyx_CppExn2PyErr();
+          #ifdef WITH_THREAD
+          PyGILState_Release(__pyx_gilstate_save);
+          #endif
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L4_error;}
+        }
+        __pyx_v_c_taps = __pyx_t_1;
+      }
+
+      /* "gr_firdes/firdes.pyx":52
  *     """
- *     cdef vector[float] c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L4_error: {
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L1_error;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "gr_firdes/firdes.pyx":54
+ *     with nogil:
+ *         c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  */
   __pyx_v_c_str = ((char *)(&(__pyx_v_c_taps[0])));
 
-  /* "gr_firdes/firdes.pyx":50
- *     cdef vector[float] c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+  /* "gr_firdes/firdes.pyx":55
+ *         c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)             # <<<<<<<<<<<<<<
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -888,43 +972,43 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject
  */
   __pyx_v_length = (__pyx_v_c_taps.size() * (sizeof(float)));
 
-  /* "gr_firdes/firdes.pyx":51
+  /* "gr_firdes/firdes.pyx":56
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)             # <<<<<<<<<<<<<<
  *     return np_taps
  * 
  */
-  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_GIVEREF(__pyx_t_8);
-  PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8);
-  __pyx_t_8 = 0;
-  __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_float32); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_10, __pyx_t_8); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_v_np_taps = __pyx_t_12;
-  __pyx_t_12 = 0;
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_np_taps = __pyx_t_6;
+  __pyx_t_6 = 0;
 
-  /* "gr_firdes/firdes.pyx":52
+  /* "gr_firdes/firdes.pyx":57
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  *     return np_taps             # <<<<<<<<<<<<<<
@@ -936,21 +1020,21 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject
   __pyx_r = __pyx_v_np_taps;
   goto __pyx_L0;
 
-  /* "gr_firdes/firdes.pyx":30
+  /* "gr_firdes/firdes.pyx":33
  * 
  * 
- * def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a high-pass FIR filter.  The
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("gr_firdes.firdes.high_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -960,10 +1044,10 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "gr_firdes/firdes.pyx":55
+/* "gr_firdes/firdes.pyx":60
  * 
  * 
- * def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a low-pass FIR filter.  The
  */
@@ -972,13 +1056,13 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_high_pass_2(CYTHON_UNUSED PyObject
 static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_9gr_firdes_6firdes_2low_pass_2[] = "\n    Use \"window method\" to design a low-pass FIR filter.  The\n    normalized width of the transition band and the required stop band\n    attenuation is what sets the number of taps required.  Narrow --> more\n    taps More attenuation --> more taps. The window type determines\n    maximum attentuation and passband ripple.\n\n    :param gain                overall gain of filter (typically 1.0)\n    :param sampling_freq       sampling freq (Hz)\n    :param cutoff_freq         beginning of transition band (Hz)\n    :param transition_width    width of transition band (Hz)\n    :param attenuation_dB      required stopband attenuation (dB)\n    :param window              one of firdes::win_type\n    :param beta\t\t           parameter for Kaiser window\n\n    :return a numpy.array() of filter taps (aka h[x], aka impulse response)\n    ";
 static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_gain = 0;
-  PyObject *__pyx_v_sampling_freq = 0;
-  PyObject *__pyx_v_cutoff_freq = 0;
-  PyObject *__pyx_v_transition_width = 0;
-  PyObject *__pyx_v_attenuation_dB = 0;
-  PyObject *__pyx_v_window = 0;
-  PyObject *__pyx_v_beta = 0;
+  double __pyx_v_gain;
+  double __pyx_v_sampling_freq;
+  double __pyx_v_cutoff_freq;
+  double __pyx_v_transition_width;
+  double __pyx_v_attenuation_dB;
+  int __pyx_v_window;
+  double __pyx_v_beta;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -988,8 +1072,6 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, P
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_gain,&__pyx_n_s_sampling_freq,&__pyx_n_s_cutoff_freq,&__pyx_n_s_transition_width,&__pyx_n_s_attenuation_dB,&__pyx_n_s_window,&__pyx_n_s_beta,0};
     PyObject* values[7] = {0,0,0,0,0,0,0};
-    values[5] = __pyx_k__2;
-    values[6] = ((PyObject *)__pyx_float_6_76);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -1012,22 +1094,22 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, P
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sampling_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_transition_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_attenuation_dB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (kw_args > 0) {
@@ -1041,7 +1123,7 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, P
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "low_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "low_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1056,17 +1138,25 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, P
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_gain = values[0];
-    __pyx_v_sampling_freq = values[1];
-    __pyx_v_cutoff_freq = values[2];
-    __pyx_v_transition_width = values[3];
-    __pyx_v_attenuation_dB = values[4];
-    __pyx_v_window = values[5];
-    __pyx_v_beta = values[6];
+    __pyx_v_gain = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_gain == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sampling_freq = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_sampling_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_cutoff_freq = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_transition_width = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_transition_width == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_attenuation_dB = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_attenuation_dB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[5]) {
+      __pyx_v_window = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_window == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_window = __pyx_k__2;
+    }
+    if (values[6]) {
+      __pyx_v_beta = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_beta = ((double)6.76);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("low_pass_2", 0, 5, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("gr_firdes.firdes.low_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1079,57 +1169,95 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_3low_pass_2(PyObject *__pyx_self, P
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta) {
+static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta) {
   std::vector<float>  __pyx_v_c_taps;
   char *__pyx_v_c_str;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_np_taps = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
-  double __pyx_t_2;
-  double __pyx_t_3;
-  double __pyx_t_4;
-  double __pyx_t_5;
-  enum gr::filter::firdes::win_type __pyx_t_6;
-  double __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
+  std::vector<float>  __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("low_pass_2", 0);
 
-  /* "gr_firdes/firdes.pyx":73
- *     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
+  /* "gr_firdes/firdes.pyx":79
  *     """
- *     cdef vector[float] c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)             # <<<<<<<<<<<<<<
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "gr_firdes/firdes.pyx":80
+ *     cdef vector[float] c_taps
+ *     with nogil:
+ *         c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)             # <<<<<<<<<<<<<<
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_gain); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_v_sampling_freq); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_v_cutoff_freq); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_transition_width); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_attenuation_dB); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = ((enum gr::filter::firdes::win_type)__Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(__pyx_v_window)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_v_beta); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_c_taps = gr::filter::firdes::low_pass_2(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7);
-
-  /* "gr_firdes/firdes.pyx":74
+        try {
+          __pyx_t_1 = gr::filter::firdes::low_pass_2(__pyx_v_gain, __pyx_v_sampling_freq, __pyx_v_cutoff_freq, __pyx_v_transition_width, __pyx_v_attenuation_dB, ((enum gr::filter::firdes::win_type)__pyx_v_window), __pyx_v_beta);
+        } catch(...) {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+          #endif
+          __Pyx_CppExn2PyErr();
+          #ifdef WITH_THREAD
+          PyGILState_Release(__pyx_gilstate_save);
+          #endif
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L4_error;}
+        }
+        __pyx_v_c_taps = __pyx_t_1;
+      }
+
+      /* "gr_firdes/firdes.pyx":79
  *     """
- *     cdef vector[float] c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L4_error: {
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L1_error;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "gr_firdes/firdes.pyx":81
+ *     with nogil:
+ *         c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  */
   __pyx_v_c_str = ((char *)(&(__pyx_v_c_taps[0])));
 
-  /* "gr_firdes/firdes.pyx":75
- *     cdef vector[float] c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+  /* "gr_firdes/firdes.pyx":82
+ *         c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)             # <<<<<<<<<<<<<<
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -1137,43 +1265,43 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject
  */
   __pyx_v_length = (__pyx_v_c_taps.size() * (sizeof(float)));
 
-  /* "gr_firdes/firdes.pyx":76
+  /* "gr_firdes/firdes.pyx":83
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)             # <<<<<<<<<<<<<<
  *     return np_taps
  * 
  */
-  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_10 = PyTuple_New(1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_GIVEREF(__pyx_t_8);
-  PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8);
-  __pyx_t_8 = 0;
-  __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_float32); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_dtype, __pyx_t_12) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_10, __pyx_t_8); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_v_np_taps = __pyx_t_12;
-  __pyx_t_12 = 0;
-
-  /* "gr_firdes/firdes.pyx":77
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_np_taps = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "gr_firdes/firdes.pyx":84
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  *     return np_taps             # <<<<<<<<<<<<<<
@@ -1185,21 +1313,21 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject
   __pyx_r = __pyx_v_np_taps;
   goto __pyx_L0;
 
-  /* "gr_firdes/firdes.pyx":55
+  /* "gr_firdes/firdes.pyx":60
  * 
  * 
- * def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a low-pass FIR filter.  The
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("gr_firdes.firdes.low_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -1209,10 +1337,10 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "gr_firdes/firdes.pyx":80
+/* "gr_firdes/firdes.pyx":87
  * 
  * 
- * def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-pass FIR filter.  The
  */
@@ -1221,14 +1349,14 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_2low_pass_2(CYTHON_UNUSED PyObject
 static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_9gr_firdes_6firdes_4band_pass_2[] = "\n    Use \"window method\" to design a band-pass FIR filter.  The\n    normalized width of the transition band and the required stop band\n    attenuation is what sets the number of taps required.  Narrow --> more\n    taps More attenuation --> more taps. The window type determines\n    maximum attentuation and passband ripple.\n\n    :param gain                overall gain of filter (typically 1.0)\n    :param sampling_freq       sampling freq (Hz)\n    :param low_cutoff_freq     center of transition band (Hz)\n    :param high_cutoff_freq    center of transition band (Hz)\n    :param transition_width    width of transition band (Hz)\n    :param attenuation_dB      required stopband attenuation (dB)\n    :param window              one of firdes::win_type\n    :param beta\t\t           parameter for Kaiser window\n\n    :return a numpy.array() of filter taps (aka h[x], aka impulse response)\n    ";
 static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_gain = 0;
-  PyObject *__pyx_v_sampling_freq = 0;
-  PyObject *__pyx_v_low_cutoff_freq = 0;
-  PyObject *__pyx_v_high_cutoff_freq = 0;
-  PyObject *__pyx_v_transition_width = 0;
-  PyObject *__pyx_v_attenuation_dB = 0;
-  PyObject *__pyx_v_window = 0;
-  PyObject *__pyx_v_beta = 0;
+  double __pyx_v_gain;
+  double __pyx_v_sampling_freq;
+  double __pyx_v_low_cutoff_freq;
+  double __pyx_v_high_cutoff_freq;
+  double __pyx_v_transition_width;
+  double __pyx_v_attenuation_dB;
+  int __pyx_v_window;
+  double __pyx_v_beta;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1238,8 +1366,6 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self,
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_gain,&__pyx_n_s_sampling_freq,&__pyx_n_s_low_cutoff_freq,&__pyx_n_s_high_cutoff_freq,&__pyx_n_s_transition_width,&__pyx_n_s_attenuation_dB,&__pyx_n_s_window,&__pyx_n_s_beta,0};
     PyObject* values[8] = {0,0,0,0,0,0,0,0};
-    values[6] = __pyx_k__3;
-    values[7] = ((PyObject *)__pyx_float_6_76);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -1263,27 +1389,27 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self,
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sampling_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_low_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_high_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_transition_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_attenuation_dB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (kw_args > 0) {
@@ -1297,7 +1423,7 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self,
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "band_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "band_pass_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1313,18 +1439,26 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self,
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_gain = values[0];
-    __pyx_v_sampling_freq = values[1];
-    __pyx_v_low_cutoff_freq = values[2];
-    __pyx_v_high_cutoff_freq = values[3];
-    __pyx_v_transition_width = values[4];
-    __pyx_v_attenuation_dB = values[5];
-    __pyx_v_window = values[6];
-    __pyx_v_beta = values[7];
+    __pyx_v_gain = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_gain == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sampling_freq = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_sampling_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_low_cutoff_freq = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_low_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_high_cutoff_freq = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_high_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_transition_width = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_transition_width == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_attenuation_dB = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_attenuation_dB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[6]) {
+      __pyx_v_window = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_window == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_window = __pyx_k__3;
+    }
+    if (values[7]) {
+      __pyx_v_beta = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_beta = ((double)6.76);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("band_pass_2", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("gr_firdes.firdes.band_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1337,59 +1471,95 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_5band_pass_2(PyObject *__pyx_self,
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_low_cutoff_freq, PyObject *__pyx_v_high_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta) {
+static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_low_cutoff_freq, double __pyx_v_high_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta) {
   std::vector<float>  __pyx_v_c_taps;
   char *__pyx_v_c_str;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_np_taps = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
-  double __pyx_t_2;
-  double __pyx_t_3;
-  double __pyx_t_4;
-  double __pyx_t_5;
-  double __pyx_t_6;
-  enum gr::filter::firdes::win_type __pyx_t_7;
-  double __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
+  std::vector<float>  __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("band_pass_2", 0);
 
-  /* "gr_firdes/firdes.pyx":99
- *     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
+  /* "gr_firdes/firdes.pyx":107
  *     """
- *     cdef vector[float] c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)             # <<<<<<<<<<<<<<
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "gr_firdes/firdes.pyx":108
+ *     cdef vector[float] c_taps
+ *     with nogil:
+ *         c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)             # <<<<<<<<<<<<<<
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_gain); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_v_sampling_freq); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_v_low_cutoff_freq); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_high_cutoff_freq); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_transition_width); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_attenuation_dB); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = ((enum gr::filter::firdes::win_type)__Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(__pyx_v_window)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_beta); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_c_taps = gr::filter::firdes::band_pass_2(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7, __pyx_t_8);
-
-  /* "gr_firdes/firdes.pyx":100
+        try {
+          __pyx_t_1 = gr::filter::firdes::band_pass_2(__pyx_v_gain, __pyx_v_sampling_freq, __pyx_v_low_cutoff_freq, __pyx_v_high_cutoff_freq, __pyx_v_transition_width, __pyx_v_attenuation_dB, ((enum gr::filter::firdes::win_type)__pyx_v_window), __pyx_v_beta);
+        } catch(...) {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+          #endif
+          __Pyx_CppExn2PyErr();
+          #ifdef WITH_THREAD
+          PyGILState_Release(__pyx_gilstate_save);
+          #endif
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L4_error;}
+        }
+        __pyx_v_c_taps = __pyx_t_1;
+      }
+
+      /* "gr_firdes/firdes.pyx":107
  *     """
- *     cdef vector[float] c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L4_error: {
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L1_error;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "gr_firdes/firdes.pyx":109
+ *     with nogil:
+ *         c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  */
   __pyx_v_c_str = ((char *)(&(__pyx_v_c_taps[0])));
 
-  /* "gr_firdes/firdes.pyx":101
- *     cdef vector[float] c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+  /* "gr_firdes/firdes.pyx":110
+ *         c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)             # <<<<<<<<<<<<<<
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -1397,43 +1567,43 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject
  */
   __pyx_v_length = (__pyx_v_c_taps.size() * (sizeof(float)));
 
-  /* "gr_firdes/firdes.pyx":102
+  /* "gr_firdes/firdes.pyx":111
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)             # <<<<<<<<<<<<<<
  *     return np_taps
  * 
  */
-  __pyx_t_9 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_9);
-  PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9);
-  __pyx_t_9 = 0;
-  __pyx_t_9 = PyDict_New(); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_float32); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_11, __pyx_t_9); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_v_np_taps = __pyx_t_13;
-  __pyx_t_13 = 0;
-
-  /* "gr_firdes/firdes.pyx":103
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_np_taps = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "gr_firdes/firdes.pyx":112
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  *     return np_taps             # <<<<<<<<<<<<<<
@@ -1445,21 +1615,21 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject
   __pyx_r = __pyx_v_np_taps;
   goto __pyx_L0;
 
-  /* "gr_firdes/firdes.pyx":80
+  /* "gr_firdes/firdes.pyx":87
  * 
  * 
- * def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-pass FIR filter.  The
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("gr_firdes.firdes.band_pass_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -1469,10 +1639,10 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "gr_firdes/firdes.pyx":106
+/* "gr_firdes/firdes.pyx":115
  * 
  * 
- * def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-reject FIR filter.  The
  */
@@ -1481,14 +1651,14 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_4band_pass_2(CYTHON_UNUSED PyObject
 static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_9gr_firdes_6firdes_6band_reject_2[] = "\n    Use \"window method\" to design a band-reject FIR filter.  The\n    normalized width of the transition band and the required stop band\n    attenuation is what sets the number of taps required.  Narrow --> more\n    taps More attenuation --> more taps. The window type determines\n    maximum attentuation and passband ripple.\n\n    :param gain                overall gain of filter (typically 1.0)\n    :param sampling_freq       sampling freq (Hz)\n    :param low_cutoff_freq     center of transition band (Hz)\n    :param high_cutoff_freq    center of transition band (Hz)\n    :param transition_width    width of transition band (Hz)\n    :param attenuation_dB      required stopband attenuation (dB)\n    :param window              one of firdes::win_type\n    :param beta\t\t           parameter for Kaiser window\n\n    :return a numpy.array() of filter taps (aka h[x], aka impulse response)\n    ";
 static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_gain = 0;
-  PyObject *__pyx_v_sampling_freq = 0;
-  PyObject *__pyx_v_low_cutoff_freq = 0;
-  PyObject *__pyx_v_high_cutoff_freq = 0;
-  PyObject *__pyx_v_transition_width = 0;
-  PyObject *__pyx_v_attenuation_dB = 0;
-  PyObject *__pyx_v_window = 0;
-  PyObject *__pyx_v_beta = 0;
+  double __pyx_v_gain;
+  double __pyx_v_sampling_freq;
+  double __pyx_v_low_cutoff_freq;
+  double __pyx_v_high_cutoff_freq;
+  double __pyx_v_transition_width;
+  double __pyx_v_attenuation_dB;
+  int __pyx_v_window;
+  double __pyx_v_beta;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1498,8 +1668,6 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_gain,&__pyx_n_s_sampling_freq,&__pyx_n_s_low_cutoff_freq,&__pyx_n_s_high_cutoff_freq,&__pyx_n_s_transition_width,&__pyx_n_s_attenuation_dB,&__pyx_n_s_window,&__pyx_n_s_beta,0};
     PyObject* values[8] = {0,0,0,0,0,0,0,0};
-    values[6] = __pyx_k__4;
-    values[7] = ((PyObject *)__pyx_float_6_76);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -1523,27 +1691,27 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sampling_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_low_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_high_cutoff_freq)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_transition_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_attenuation_dB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (kw_args > 0) {
@@ -1557,7 +1725,7 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "band_reject_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "band_reject_2") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1573,18 +1741,26 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_gain = values[0];
-    __pyx_v_sampling_freq = values[1];
-    __pyx_v_low_cutoff_freq = values[2];
-    __pyx_v_high_cutoff_freq = values[3];
-    __pyx_v_transition_width = values[4];
-    __pyx_v_attenuation_dB = values[5];
-    __pyx_v_window = values[6];
-    __pyx_v_beta = values[7];
+    __pyx_v_gain = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_gain == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sampling_freq = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_sampling_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_low_cutoff_freq = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_low_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_high_cutoff_freq = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_high_cutoff_freq == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_transition_width = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_transition_width == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_attenuation_dB = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_attenuation_dB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[6]) {
+      __pyx_v_window = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_window == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_window = __pyx_k__4;
+    }
+    if (values[7]) {
+      __pyx_v_beta = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_beta = ((double)6.76);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("band_reject_2", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("gr_firdes.firdes.band_reject_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1597,59 +1773,95 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_7band_reject_2(PyObject *__pyx_self
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_gain, PyObject *__pyx_v_sampling_freq, PyObject *__pyx_v_low_cutoff_freq, PyObject *__pyx_v_high_cutoff_freq, PyObject *__pyx_v_transition_width, PyObject *__pyx_v_attenuation_dB, PyObject *__pyx_v_window, PyObject *__pyx_v_beta) {
+static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_gain, double __pyx_v_sampling_freq, double __pyx_v_low_cutoff_freq, double __pyx_v_high_cutoff_freq, double __pyx_v_transition_width, double __pyx_v_attenuation_dB, int __pyx_v_window, double __pyx_v_beta) {
   std::vector<float>  __pyx_v_c_taps;
   char *__pyx_v_c_str;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_np_taps = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  double __pyx_t_1;
-  double __pyx_t_2;
-  double __pyx_t_3;
-  double __pyx_t_4;
-  double __pyx_t_5;
-  double __pyx_t_6;
-  enum gr::filter::firdes::win_type __pyx_t_7;
-  double __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
+  std::vector<float>  __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("band_reject_2", 0);
 
-  /* "gr_firdes/firdes.pyx":125
- *     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
+  /* "gr_firdes/firdes.pyx":135
  *     """
- *     cdef vector[float] c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)             # <<<<<<<<<<<<<<
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "gr_firdes/firdes.pyx":136
+ *     cdef vector[float] c_taps
+ *     with nogil:
+ *         c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)             # <<<<<<<<<<<<<<
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsDouble(__pyx_v_gain); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __pyx_PyFloat_AsDouble(__pyx_v_sampling_freq); if (unlikely((__pyx_t_2 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_v_low_cutoff_freq); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_v_high_cutoff_freq); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_v_transition_width); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_v_attenuation_dB); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_7 = ((enum gr::filter::firdes::win_type)__Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(__pyx_v_window)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_beta); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_c_taps = gr::filter::firdes::band_reject_2(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7, __pyx_t_8);
-
-  /* "gr_firdes/firdes.pyx":126
+        try {
+          __pyx_t_1 = gr::filter::firdes::band_reject_2(__pyx_v_gain, __pyx_v_sampling_freq, __pyx_v_low_cutoff_freq, __pyx_v_high_cutoff_freq, __pyx_v_transition_width, __pyx_v_attenuation_dB, ((enum gr::filter::firdes::win_type)__pyx_v_window), __pyx_v_beta);
+        } catch(...) {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+          #endif
+          __Pyx_CppExn2PyErr();
+          #ifdef WITH_THREAD
+          PyGILState_Release(__pyx_gilstate_save);
+          #endif
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L4_error;}
+        }
+        __pyx_v_c_taps = __pyx_t_1;
+      }
+
+      /* "gr_firdes/firdes.pyx":135
  *     """
- *     cdef vector[float] c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L4_error: {
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L1_error;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "gr_firdes/firdes.pyx":137
+ *     with nogil:
+ *         c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  */
   __pyx_v_c_str = ((char *)(&(__pyx_v_c_taps[0])));
 
-  /* "gr_firdes/firdes.pyx":127
- *     cdef vector[float] c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+  /* "gr_firdes/firdes.pyx":138
+ *         c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)             # <<<<<<<<<<<<<<
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -1657,43 +1869,43 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObje
  */
   __pyx_v_length = (__pyx_v_c_taps.size() * (sizeof(float)));
 
-  /* "gr_firdes/firdes.pyx":128
+  /* "gr_firdes/firdes.pyx":139
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)             # <<<<<<<<<<<<<<
  *     return np_taps
  * 
  */
-  __pyx_t_9 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_11);
-  __Pyx_GIVEREF(__pyx_t_9);
-  PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9);
-  __pyx_t_9 = 0;
-  __pyx_t_9 = PyDict_New(); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_12);
-  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_float32); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_dtype, __pyx_t_13) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_11, __pyx_t_9); if (unlikely(!__pyx_t_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_13);
-  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_v_np_taps = __pyx_t_13;
-  __pyx_t_13 = 0;
-
-  /* "gr_firdes/firdes.pyx":129
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_np_taps = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "gr_firdes/firdes.pyx":140
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  *     return np_taps             # <<<<<<<<<<<<<<
@@ -1705,21 +1917,21 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObje
   __pyx_r = __pyx_v_np_taps;
   goto __pyx_L0;
 
-  /* "gr_firdes/firdes.pyx":106
+  /* "gr_firdes/firdes.pyx":115
  * 
  * 
- * def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-reject FIR filter.  The
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("gr_firdes.firdes.band_reject_2", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -1729,10 +1941,10 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObje
   return __pyx_r;
 }
 
-/* "gr_firdes/firdes.pyx":132
+/* "gr_firdes/firdes.pyx":143
  * 
  * 
- * def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def hilbert(unsigned int ntaps, int window = WinType.WIN_RECTANGULAR, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     design a Hilbert Transform Filter
  */
@@ -1741,9 +1953,9 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_6band_reject_2(CYTHON_UNUSED PyObje
 static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_9gr_firdes_6firdes_8hilbert[] = "\n    design a Hilbert Transform Filter\n\n    :param ntaps   number of taps, must be odd\n    :param window  one kind of firdes::win_type\n    :param beta\t   parameter for Kaiser window\n\n    :return a numpy.array() of filter taps (aka h[x], aka impulse response)\n    ";
 static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_ntaps = 0;
-  PyObject *__pyx_v_window = 0;
-  PyObject *__pyx_v_beta = 0;
+  unsigned int __pyx_v_ntaps;
+  int __pyx_v_window;
+  double __pyx_v_beta;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1753,8 +1965,6 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyOb
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ntaps,&__pyx_n_s_window,&__pyx_n_s_beta,0};
     PyObject* values[3] = {0,0,0};
-    values[1] = __pyx_k__5;
-    values[2] = ((PyObject *)__pyx_float_6_76);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
@@ -1782,7 +1992,7 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyOb
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "hilbert") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "hilbert") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1793,13 +2003,21 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyOb
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_ntaps = values[0];
-    __pyx_v_window = values[1];
-    __pyx_v_beta = values[2];
+    __pyx_v_ntaps = __Pyx_PyInt_As_unsigned_int(values[0]); if (unlikely((__pyx_v_ntaps == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[1]) {
+      __pyx_v_window = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_window == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_window = __pyx_k__5;
+    }
+    if (values[2]) {
+      __pyx_v_beta = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_beta == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_beta = ((double)6.76);
+    }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("hilbert", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("hilbert", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("gr_firdes.firdes.hilbert", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1812,49 +2030,95 @@ static PyObject *__pyx_pw_9gr_firdes_6firdes_9hilbert(PyObject *__pyx_self, PyOb
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_ntaps, PyObject *__pyx_v_window, PyObject *__pyx_v_beta) {
+static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__pyx_self, unsigned int __pyx_v_ntaps, int __pyx_v_window, double __pyx_v_beta) {
   std::vector<float>  __pyx_v_c_taps;
   char *__pyx_v_c_str;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_np_taps = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  unsigned int __pyx_t_1;
-  enum gr::filter::firdes::win_type __pyx_t_2;
-  double __pyx_t_3;
+  std::vector<float>  __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("hilbert", 0);
 
-  /* "gr_firdes/firdes.pyx":142
- *     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
+  /* "gr_firdes/firdes.pyx":154
  *     """
- *     cdef vector[float] c_taps = c_hilbert(ntaps, window, beta)             # <<<<<<<<<<<<<<
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_hilbert(ntaps, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "gr_firdes/firdes.pyx":155
+ *     cdef vector[float] c_taps
+ *     with nogil:
+ *         c_taps = c_hilbert(ntaps, <win_type> window, beta)             # <<<<<<<<<<<<<<
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_int(__pyx_v_ntaps); if (unlikely((__pyx_t_1 == (unsigned int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = ((enum gr::filter::firdes::win_type)__Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(__pyx_v_window)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_v_beta); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_c_taps = gr::filter::firdes::hilbert(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+        try {
+          __pyx_t_1 = gr::filter::firdes::hilbert(__pyx_v_ntaps, ((enum gr::filter::firdes::win_type)__pyx_v_window), __pyx_v_beta);
+        } catch(...) {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+          #endif
+          __Pyx_CppExn2PyErr();
+          #ifdef WITH_THREAD
+          PyGILState_Release(__pyx_gilstate_save);
+          #endif
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L4_error;}
+        }
+        __pyx_v_c_taps = __pyx_t_1;
+      }
 
-  /* "gr_firdes/firdes.pyx":143
+      /* "gr_firdes/firdes.pyx":154
  *     """
- *     cdef vector[float] c_taps = c_hilbert(ntaps, window, beta)
+ *     cdef vector[float] c_taps
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         c_taps = c_hilbert(ntaps, <win_type> window, beta)
+ *     cdef char *c_str = <char *> &c_taps[0]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L4_error: {
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L1_error;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "gr_firdes/firdes.pyx":156
+ *     with nogil:
+ *         c_taps = c_hilbert(ntaps, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]             # <<<<<<<<<<<<<<
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  */
   __pyx_v_c_str = ((char *)(&(__pyx_v_c_taps[0])));
 
-  /* "gr_firdes/firdes.pyx":144
- *     cdef vector[float] c_taps = c_hilbert(ntaps, window, beta)
+  /* "gr_firdes/firdes.pyx":157
+ *         c_taps = c_hilbert(ntaps, <win_type> window, beta)
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)             # <<<<<<<<<<<<<<
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -1862,42 +2126,42 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__
  */
   __pyx_v_length = (__pyx_v_c_taps.size() * (sizeof(float)));
 
-  /* "gr_firdes/firdes.pyx":145
+  /* "gr_firdes/firdes.pyx":158
  *     cdef char *c_str = <char *> &c_taps[0]
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)             # <<<<<<<<<<<<<<
  *     return np_taps
  */
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyBytes_FromStringAndSize(__pyx_v_c_str + 0, __pyx_v_length - 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_float32); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_np_taps = __pyx_t_8;
-  __pyx_t_8 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_np_taps = __pyx_t_6;
+  __pyx_t_6 = 0;
 
-  /* "gr_firdes/firdes.pyx":146
+  /* "gr_firdes/firdes.pyx":159
  *     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
  *     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
  *     return np_taps             # <<<<<<<<<<<<<<
@@ -1907,21 +2171,21 @@ static PyObject *__pyx_pf_9gr_firdes_6firdes_8hilbert(CYTHON_UNUSED PyObject *__
   __pyx_r = __pyx_v_np_taps;
   goto __pyx_L0;
 
-  /* "gr_firdes/firdes.pyx":132
+  /* "gr_firdes/firdes.pyx":143
  * 
  * 
- * def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def hilbert(unsigned int ntaps, int window = WinType.WIN_RECTANGULAR, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     design a Hilbert Transform Filter
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("gr_firdes.firdes.hilbert", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2080,7 +2344,6 @@ static int __Pyx_InitCachedConstants(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_float_6_76 = PyFloat_FromDouble(6.76); if (unlikely(!__pyx_float_6_76)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -2104,6 +2367,7 @@ PyMODINIT_FUNC PyInit_firdes(void)
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2181,9 +2445,9 @@ PyMODINIT_FUNC PyInit_firdes(void)
   /*--- Variable export code ---*/
   /*--- Function export code ---*/
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_9gr_firdes_6firdes_WinType) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_9gr_firdes_6firdes_WinType) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_9gr_firdes_6firdes_WinType.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "WinType", (PyObject *)&__pyx_type_9gr_firdes_6firdes_WinType) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "WinType", (PyObject *)&__pyx_type_9gr_firdes_6firdes_WinType) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_9gr_firdes_6firdes_WinType = &__pyx_type_9gr_firdes_6firdes_WinType;
   /*--- Type import code ---*/
   /*--- Variable import code ---*/
@@ -2193,182 +2457,182 @@ PyMODINIT_FUNC PyInit_firdes(void)
   if (__Pyx_patch_abc() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   #endif
 
-  /* "gr_firdes/firdes.pyx":14
- * from firdes cimport band_reject_2 as c_band_reject_2
+  /* "gr_firdes/firdes.pyx":17
  * from firdes cimport hilbert as c_hilbert
+ * from firdes cimport win_type
  * import numpy as np             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gr_firdes/firdes.pyx":18
+  /* "gr_firdes/firdes.pyx":21
  * 
  * cdef class WinType:
  *     WIN_NONE = -1           #: don't use a window             # <<<<<<<<<<<<<<
  *     WIN_HAMMING = 0         #: Hamming window; max attenuation 53 dB
  *     WIN_HANN = 1            #: Hann window; max attenuation 44 dB
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_NONE, __pyx_int_neg_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_NONE, __pyx_int_neg_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":19
+  /* "gr_firdes/firdes.pyx":22
  * cdef class WinType:
  *     WIN_NONE = -1           #: don't use a window
  *     WIN_HAMMING = 0         #: Hamming window; max attenuation 53 dB             # <<<<<<<<<<<<<<
  *     WIN_HANN = 1            #: Hann window; max attenuation 44 dB
  *     WIN_BLACKMAN = 2        #: Blackman window; max attenuation 74 dB
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_HAMMING, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_HAMMING, __pyx_int_0) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":20
+  /* "gr_firdes/firdes.pyx":23
  *     WIN_NONE = -1           #: don't use a window
  *     WIN_HAMMING = 0         #: Hamming window; max attenuation 53 dB
  *     WIN_HANN = 1            #: Hann window; max attenuation 44 dB             # <<<<<<<<<<<<<<
  *     WIN_BLACKMAN = 2        #: Blackman window; max attenuation 74 dB
  *     WIN_RECTANGULAR = 3     #: Basic rectangular window
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_HANN, __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_HANN, __pyx_int_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":21
+  /* "gr_firdes/firdes.pyx":24
  *     WIN_HAMMING = 0         #: Hamming window; max attenuation 53 dB
  *     WIN_HANN = 1            #: Hann window; max attenuation 44 dB
  *     WIN_BLACKMAN = 2        #: Blackman window; max attenuation 74 dB             # <<<<<<<<<<<<<<
  *     WIN_RECTANGULAR = 3     #: Basic rectangular window
  *     WIN_KAISER = 4          #: Kaiser window; max attenuation a function of beta, google it
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN, __pyx_int_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN, __pyx_int_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":22
+  /* "gr_firdes/firdes.pyx":25
  *     WIN_HANN = 1            #: Hann window; max attenuation 44 dB
  *     WIN_BLACKMAN = 2        #: Blackman window; max attenuation 74 dB
  *     WIN_RECTANGULAR = 3     #: Basic rectangular window             # <<<<<<<<<<<<<<
  *     WIN_KAISER = 4          #: Kaiser window; max attenuation a function of beta, google it
  *     WIN_BLACKMAN_hARRIS = 5 #: Blackman-harris window
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_RECTANGULAR, __pyx_int_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_RECTANGULAR, __pyx_int_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":23
+  /* "gr_firdes/firdes.pyx":26
  *     WIN_BLACKMAN = 2        #: Blackman window; max attenuation 74 dB
  *     WIN_RECTANGULAR = 3     #: Basic rectangular window
  *     WIN_KAISER = 4          #: Kaiser window; max attenuation a function of beta, google it             # <<<<<<<<<<<<<<
  *     WIN_BLACKMAN_hARRIS = 5 #: Blackman-harris window
  *     WIN_BLACKMAN_HARRIS = 5 #: alias to WIN_BLACKMAN_hARRIS for capitalization consistency
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_KAISER, __pyx_int_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_KAISER, __pyx_int_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 26; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":24
+  /* "gr_firdes/firdes.pyx":27
  *     WIN_RECTANGULAR = 3     #: Basic rectangular window
  *     WIN_KAISER = 4          #: Kaiser window; max attenuation a function of beta, google it
  *     WIN_BLACKMAN_hARRIS = 5 #: Blackman-harris window             # <<<<<<<<<<<<<<
  *     WIN_BLACKMAN_HARRIS = 5 #: alias to WIN_BLACKMAN_hARRIS for capitalization consistency
  *     WIN_BARTLETT = 6        #: Barlett (triangular) window
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN_hARRIS, __pyx_int_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN_hARRIS, __pyx_int_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":25
+  /* "gr_firdes/firdes.pyx":28
  *     WIN_KAISER = 4          #: Kaiser window; max attenuation a function of beta, google it
  *     WIN_BLACKMAN_hARRIS = 5 #: Blackman-harris window
  *     WIN_BLACKMAN_HARRIS = 5 #: alias to WIN_BLACKMAN_hARRIS for capitalization consistency             # <<<<<<<<<<<<<<
  *     WIN_BARTLETT = 6        #: Barlett (triangular) window
  *     WIN_FLATTOP = 7         #: flat top window; useful in FFTs
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN_HARRIS, __pyx_int_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BLACKMAN_HARRIS, __pyx_int_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":26
+  /* "gr_firdes/firdes.pyx":29
  *     WIN_BLACKMAN_hARRIS = 5 #: Blackman-harris window
  *     WIN_BLACKMAN_HARRIS = 5 #: alias to WIN_BLACKMAN_hARRIS for capitalization consistency
  *     WIN_BARTLETT = 6        #: Barlett (triangular) window             # <<<<<<<<<<<<<<
  *     WIN_FLATTOP = 7         #: flat top window; useful in FFTs
  * 
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BARTLETT, __pyx_int_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 26; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_BARTLETT, __pyx_int_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 29; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":27
+  /* "gr_firdes/firdes.pyx":30
  *     WIN_BLACKMAN_HARRIS = 5 #: alias to WIN_BLACKMAN_hARRIS for capitalization consistency
  *     WIN_BARTLETT = 6        #: Barlett (triangular) window
  *     WIN_FLATTOP = 7         #: flat top window; useful in FFTs             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_FLATTOP, __pyx_int_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType->tp_dict, __pyx_n_s_WIN_FLATTOP, __pyx_int_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   PyType_Modified(__pyx_ptype_9gr_firdes_6firdes_WinType);
 
-  /* "gr_firdes/firdes.pyx":30
+  /* "gr_firdes/firdes.pyx":33
  * 
  * 
- * def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a high-pass FIR filter.  The
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_ = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k_ = __pyx_t_2;
 
-  /* "gr_firdes/firdes.pyx":55
+  /* "gr_firdes/firdes.pyx":60
  * 
  * 
- * def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a low-pass FIR filter.  The
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k__2 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k__2 = __pyx_t_2;
 
-  /* "gr_firdes/firdes.pyx":80
+  /* "gr_firdes/firdes.pyx":87
  * 
  * 
- * def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-pass FIR filter.  The
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k__3 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k__3 = __pyx_t_2;
 
-  /* "gr_firdes/firdes.pyx":106
+  /* "gr_firdes/firdes.pyx":115
  * 
  * 
- * def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     Use "window method" to design a band-reject FIR filter.  The
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_HAMMING); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k__4 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k__4 = __pyx_t_2;
 
-  /* "gr_firdes/firdes.pyx":132
+  /* "gr_firdes/firdes.pyx":143
  * 
  * 
- * def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):             # <<<<<<<<<<<<<<
+ * def hilbert(unsigned int ntaps, int window = WinType.WIN_RECTANGULAR, double beta = 6.76):             # <<<<<<<<<<<<<<
  *     """
  *     design a Hilbert Transform Filter
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_RECTANGULAR); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_9gr_firdes_6firdes_WinType), __pyx_n_s_WIN_RECTANGULAR); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k__5 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k__5 = __pyx_t_2;
 
   /* "gr_firdes/firdes.pyx":1
  * # distutils: language = c++             # <<<<<<<<<<<<<<
@@ -2914,19 +3178,19 @@ bad:
   #include "longintrepr.h"
 #endif
 
-static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(PyObject *x) {
-    const enum gr::filter::firdes::win_type neg_one = (enum gr::filter::firdes::win_type) -1, const_zero = (enum gr::filter::firdes::win_type) 0;
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(enum gr::filter::firdes::win_type) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, long, PyInt_AS_LONG(x))
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (enum gr::filter::firdes::win_type) val;
+            return (int) val;
         }
     } else
 #endif
@@ -2935,32 +3199,32 @@ static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (enum gr::filter::firdes::win_type) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, digit, digits[0])
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) >= 2 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((enum gr::filter::firdes::win_type)digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) >= 3 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((((enum gr::filter::firdes::win_type)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) >= 4 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((((((enum gr::filter::firdes::win_type)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
@@ -2974,83 +3238,83 @@ static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (enum gr::filter::firdes::win_type) -1;
+                    return (int) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(enum gr::filter::firdes::win_type) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(enum gr::filter::firdes::win_type, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(enum gr::filter::firdes::win_type) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(enum gr::filter::firdes::win_type, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (enum gr::filter::firdes::win_type) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type,  digit, +digits[0])
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 2 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) -(((((enum gr::filter::firdes::win_type)digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) -(((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 2 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((enum gr::filter::firdes::win_type)digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 3 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) -(((((((enum gr::filter::firdes::win_type)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) -(((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 3 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((((enum gr::filter::firdes::win_type)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 4 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) -(((((((((enum gr::filter::firdes::win_type)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) -(((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(enum gr::filter::firdes::win_type) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(enum gr::filter::firdes::win_type, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(enum gr::filter::firdes::win_type) - 1 > 4 * PyLong_SHIFT) {
-                            return (enum gr::filter::firdes::win_type) (((((((((enum gr::filter::firdes::win_type)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(enum gr::filter::firdes::win_type) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(enum gr::filter::firdes::win_type, long, PyLong_AsLong(x))
-            } else if (sizeof(enum gr::filter::firdes::win_type) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(enum gr::filter::firdes::win_type, PY_LONG_LONG, PyLong_AsLongLong(x))
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
             }
         }
         {
@@ -3058,7 +3322,7 @@ static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            enum gr::filter::firdes::win_type val;
+            int val;
             PyObject *v = __Pyx_PyNumber_Int(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -3078,24 +3342,24 @@ static CYTHON_INLINE enum gr::filter::firdes::win_type __Pyx_PyInt_As_enum__gr_3
                     return val;
             }
 #endif
-            return (enum gr::filter::firdes::win_type) -1;
+            return (int) -1;
         }
     } else {
-        enum gr::filter::firdes::win_type val;
+        int val;
         PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (enum gr::filter::firdes::win_type) -1;
-        val = __Pyx_PyInt_As_enum__gr_3a__3a_filter_3a__3a_firdes_3a__3a_win_type(tmp);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to enum gr::filter::firdes::win_type");
-    return (enum gr::filter::firdes::win_type) -1;
+        "value too large to convert to int");
+    return (int) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to enum gr::filter::firdes::win_type");
-    return (enum gr::filter::firdes::win_type) -1;
+        "can't convert negative value to int");
+    return (int) -1;
 }
 
 static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *x) {
@@ -3492,190 +3756,6 @@ raise_neg_overflow:
     return (long) -1;
 }
 
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (int) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) -(((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) -(((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) -(((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | digits[2]) << PyLong_SHIFT) | digits[1]) << PyLong_SHIFT) | digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
 static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
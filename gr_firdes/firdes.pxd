@@ -13,9 +13,9 @@ cdef extern from "<gnuradio/filter/firdes.h>" namespace "gr::filter::firdes":
         WIN_BARTLETT = 6        #: Barlett (triangular) window
         WIN_FLATTOP = 7         #: flat top window; useful in FFTs
 
-    # static methods from class firdes
-    vector[float] high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta)
-    vector[float] low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta)
-    vector[float] band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta)
-    vector[float] band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta)
-    vector[float] hilbert(unsigned int ntaps, win_type window, double beta)
+    # static methods from class firdes (pure computations, safe to call without the GIL)
+    vector[float] high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta) nogil except +
+    vector[float] low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta) nogil except +
+    vector[float] band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta) nogil except +
+    vector[float] band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, win_type window, double beta) nogil except +
+    vector[float] hilbert(unsigned int ntaps, win_type window, double beta) nogil except +
@@ -4,6 +4,8 @@
 Finite Impulse Response (FIR) filter design functions.
 
 see http://gnuradio.org/doc/doxygen/classgr_1_1filter_1_1firdes.html
+
+The designs run without holding the GIL, so several threads can design filters in parallel.
 """
 
 from firdes cimport high_pass_2 as c_high_pass_2
@@ -11,6 +13,7 @@ from firdes cimport low_pass_2 as c_low_pass_2
 from firdes cimport band_pass_2 as c_band_pass_2
 from firdes cimport band_reject_2 as c_band_reject_2
 from firdes cimport hilbert as c_hilbert
+from firdes cimport win_type
 import numpy as np
 
 
@@ -27,7 +30,7 @@ cdef class WinType:
     WIN_FLATTOP = 7         #: flat top window; useful in FFTs
 
 
-def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+def high_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):
     """
     Use "window method" to design a high-pass FIR filter.  The
     normalized width of the transition band and the required stop band
@@ -45,14 +48,16 @@ def high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_
 
     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
     """
-    cdef vector[float] c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+    cdef vector[float] c_taps
+    with nogil:
+        c_taps = c_high_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
     cdef char *c_str = <char *> &c_taps[0]
     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
     return np_taps
 
 
-def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+def low_pass_2(double gain, double sampling_freq, double cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):
     """
     Use "window method" to design a low-pass FIR filter.  The
     normalized width of the transition band and the required stop band
@@ -70,14 +75,16 @@ def low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_d
 
     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
     """
-    cdef vector[float] c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, window, beta)
+    cdef vector[float] c_taps
+    with nogil:
+        c_taps = c_low_pass_2(gain, sampling_freq, cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
     cdef char *c_str = <char *> &c_taps[0]
     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
     return np_taps
 
 
-def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+def band_pass_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):
     """
     Use "window method" to design a band-pass FIR filter.  The
     normalized width of the transition band and the required stop band
@@ -96,14 +103,16 @@ def band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transiti
 
     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
     """
-    cdef vector[float] c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+    cdef vector[float] c_taps
+    with nogil:
+        c_taps = c_band_pass_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
     cdef char *c_str = <char *> &c_taps[0]
     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
     return np_taps
 
 
-def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window = WinType.WIN_HAMMING, beta = 6.76):
+def band_reject_2(double gain, double sampling_freq, double low_cutoff_freq, double high_cutoff_freq, double transition_width, double attenuation_dB, int window = WinType.WIN_HAMMING, double beta = 6.76):
     """
     Use "window method" to design a band-reject FIR filter.  The
     normalized width of the transition band and the required stop band
@@ -122,14 +131,16 @@ def band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transi
 
     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
     """
-    cdef vector[float] c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, window, beta)
+    cdef vector[float] c_taps
+    with nogil:
+        c_taps = c_band_reject_2(gain, sampling_freq, low_cutoff_freq, high_cutoff_freq, transition_width, attenuation_dB, <win_type> window, beta)
     cdef char *c_str = <char *> &c_taps[0]
     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
     return np_taps
 
 
-def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):
+def hilbert(unsigned int ntaps, int window = WinType.WIN_RECTANGULAR, double beta = 6.76):
     """
     design a Hilbert Transform Filter
 
@@ -139,7 +150,9 @@ def hilbert(ntaps, window = WinType.WIN_RECTANGULAR, beta = 6.76):
 
     :return a numpy.array() of filter taps (aka h[x], aka impulse response)
     """
-    cdef vector[float] c_taps = c_hilbert(ntaps, window, beta)
+    cdef vector[float] c_taps
+    with nogil:
+        c_taps = c_hilbert(ntaps, <win_type> window, beta)
     cdef char *c_str = <char *> &c_taps[0]
     cdef Py_ssize_t length = c_taps.size() * sizeof(float)
     np_taps = np.fromstring(c_str[0:length], dtype=np.float32)
@@ -78,6 +78,23 @@ namespace gr {
 			      gr_vector_const_void_star &input_items,
 			      gr_vector_void_star &output_items) = 0;
 
+      /*!
+       * Hilbert transform and PLL in one pass (real -> float): outputs the tracked frequency
+       * like work(), for the analytic signal built from real samples.
+       *
+       * \param in: noutput_items + ntaps - 1 real samples (the first ntaps - 1 are history)
+       * \param taps: Hilbert transform taps (odd ntaps, zero at even offsets from the center)
+       */
+      virtual int work_hilbert(int noutput_items, const float *in, float *out,
+                               const float *taps, int ntaps) = 0;
+
+      /*!
+       * Like work_hilbert(), but outputs the AM demodulated signal -real(vco * analytic),
+       * with the VCO output as in work2_cc().
+       */
+      virtual int work_hilbert_am(int noutput_items, const float *in, float *out,
+                                  const float *taps, int ntaps) = 0;
+
       virtual void set_loop_bandwidth(float bw) = 0;
       virtual void set_damping_factor(float df) = 0;
       virtual void set_alpha(float alpha) = 0;
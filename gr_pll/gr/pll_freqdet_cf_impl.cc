@@ -124,6 +124,56 @@ namespace gr {
       return noutput_items;
     }
 
+    gr_complex
+    pll_freqdet_cf_impl::hilbert_sample(const float *in, const float *taps, int ntaps)
+    {
+      // real part: input delayed by ntaps/2, imaginary part: FIR output.
+      // Hilbert taps are zero at even offsets from the center, so only every other tap is used.
+      const int center = ntaps / 2;
+      float imag = 0.0f;
+      for(int k = (center + 1) % 2; k < ntaps; k += 2)
+	imag += in[k] * taps[ntaps - 1 - k];
+      return gr_complex(in[center], imag);
+    }
+
+    int
+    pll_freqdet_cf_impl::work_hilbert(int noutput_items, const float *in, float *out,
+				      const float *taps, int ntaps)
+    {
+      float error;
+
+      for(int i = 0; i < noutput_items; i++) {
+	out[i] = d_freq;
+
+	error = phase_detector(hilbert_sample(in + i, taps, ntaps), d_phase);
+
+	advance_loop(error);
+	phase_wrap();
+	frequency_limit();
+      }
+      return noutput_items;
+    }
+
+    int
+    pll_freqdet_cf_impl::work_hilbert_am(int noutput_items, const float *in, float *out,
+					 const float *taps, int ntaps)
+    {
+      gr_complex sample;
+      float error;
+
+      for(int i = 0; i < noutput_items; i++) {
+	sample = hilbert_sample(in + i, taps, ntaps);
+	out[i] = -std::real(std::polar(1.0f, d_phase) * sample);
+
+	error = phase_detector(sample, d_phase);
+
+	advance_loop(error);
+	phase_wrap();
+	frequency_limit();
+      }
+      return noutput_items;
+    }
+
     void
     pll_freqdet_cf_impl::set_loop_bandwidth(float bw)
     {
@@ -33,6 +33,7 @@ namespace gr {
     {
     private:
       float phase_detector(gr_complex sample,float ref_phase);
+      gr_complex hilbert_sample(const float *in, const float *taps, int ntaps);
 
     public:
       pll_freqdet_cf_impl(float loop_bw, float max_freq, float min_freq);
@@ -65,6 +66,12 @@ namespace gr {
       int work2_cc(int noutput_items,
 	       gr_vector_const_void_star &input_items,
 	       gr_vector_void_star &output_items);
+
+      int work_hilbert(int noutput_items, const float *in, float *out,
+		       const float *taps, int ntaps);
+
+      int work_hilbert_am(int noutput_items, const float *in, float *out,
+			  const float *taps, int ntaps);
     };
 
   } /* namespace analog */
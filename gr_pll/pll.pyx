@@ -18,17 +18,37 @@ cdef extern from "<gnuradio/analog/pll_freqdet_cf.h>" namespace "gr::analog":
     cdef cppclass pll_freqdet_cf:
         int work(int noutput_items,
 			      gr_vector_const_void_star &input_items,
-			      gr_vector_void_star &output_items)
+			      gr_vector_void_star &output_items) nogil
 
         int work2_cc(int noutput_items,
 			      gr_vector_const_void_star &input_items,
-			      gr_vector_void_star &output_items)
+			      gr_vector_void_star &output_items) nogil
+
+        void set_frequency(float freq)
+        void set_phase(float phase)
+        float get_frequency()
+        float get_phase()
+
+        int work_hilbert(int noutput_items, const float *input_items, float *output_items,
+                         const float *taps, int ntaps) nogil
+
+        int work_hilbert_am(int noutput_items, const float *input_items, float *output_items,
+                            const float *taps, int ntaps) nogil
 
 cdef extern from "<gnuradio/analog/pll_freqdet_cf.h>" namespace "gr::analog::pll_freqdet_cf":
     # static method from class pll_freqdet_cf
     #shared_ptr[pll_freqdet_cf] make(float loop_bw, float max_freq, float min_freq)
     pll_freqdet_cf *make(float loop_bw, float max_freq, float min_freq)
 
+def _output_buffer(out, n, dtype):
+    """:returns out, checked to fit n items, or a new array if out is None"""
+    if out is None:
+        return np.empty(n, dtype=dtype)
+    if len(out) != n:
+        raise ValueError('output buffer has length {}, expected {}'.format(len(out), n))
+    return out
+
+
 cdef class PLL:
     """
     Implements a PLL which locks to the input frequency and outputs an estimate of that frequency. Useful for FM Demod.
@@ -41,6 +61,10 @@ cdef class PLL:
     The loop bandwidth determines the lock range and should be set around sampling_rate * [pi/200; 2pi/100].
 
     see http://gnuradio.org/doc/doxygen/classgr_1_1analog_1_1pll__freqdet__cf.html#details
+
+    The sample loop runs without holding the GIL, so independent PLL instances (e.g. decoding different recordings)
+    run in parallel threads. A PLL instance itself is single-owner: it keeps the loop state across calls
+    and must not be used by several threads at the same time.
     """
 
     cdef int _i
@@ -63,30 +87,44 @@ cdef class PLL:
     def __dealloc__(self):
         del self._ptr
 
-    def filter_cf(self, x):
+    def get_state(self):
+        """:returns dict of the loop state: VCO phase (radians) and frequency (radians per sample)"""
+        return {'phase': self._ptr.get_phase(), 'freq': self._ptr.get_frequency()}
+
+    def set_state(self, state):
+        """restore the loop state returned by get_state()"""
+        phase, freq = float(state['phase']), float(state['freq'])
+        self._ptr.set_phase(phase)
+        self._ptr.set_frequency(freq)
+
+    def filter_cf(self, x, out=None):
         """
         FM demodulator (complex -> float).
-        :param x: array of complex numbers (analytic input signal)
+        :param x: array of complex numbers (analytic input signal). Not copied if it is a contiguous complex64 array.
+        :param out: optional contiguous float32 array of len(x), to write the output into
         :returns: demodulated frequency values, as array of float numbers (I think these are in radians per sample -- normalize/convert back to Hz if required)
         """
 
         # wrap to the exact data types required by _work():
-        pll_in = np.array(x, dtype=np.complex64)
-        pll_out = np.zeros(len(pll_in), dtype=np.float32)
-        self._work(pll_in, pll_out)
+        pll_in = np.ascontiguousarray(x, dtype=np.complex64)
+        pll_out = _output_buffer(out, len(pll_in), np.float32)
+        if len(pll_in) > 0:
+            self._work(pll_in, pll_out)
         return pll_out
 
-    def filter_cc(self, x):
+    def filter_cc(self, x, out=None):
         """
         Local oscillator for AM demodulator (complex -> complex).
-        :param x: array of complex numbers (analytic input signal)
+        :param x: array of complex numbers (analytic input signal). Not copied if it is a contiguous complex64 array.
+        :param out: optional contiguous complex64 array of len(x), to write the output into
         :returns: VCO output, as array of complex numbers
         """
 
-        # wrap to the exact data types required by _work():
-        pll_in = np.array(x, dtype=np.complex64)
-        pll_out = np.zeros(len(pll_in), dtype=np.complex64)
-        self._work2_cc(pll_in, pll_out)
+        # wrap to the exact data types required by _work2_cc():
+        pll_in = np.ascontiguousarray(x, dtype=np.complex64)
+        pll_out = _output_buffer(out, len(pll_in), np.complex64)
+        if len(pll_in) > 0:
+            self._work2_cc(pll_in, pll_out)
         return pll_out
 
     def _work(self, input_items, output_items):
@@ -103,13 +141,17 @@ cdef class PLL:
         In [13]: output=np.zeros(2, dtype=np.float32)
         In [15]: pll.work(input, output)
         """
-        cdef complex64_t[:] input_view = input_items
-        cdef float[:] output_view = output_items
+        cdef complex64_t[::1] input_view = input_items
+        cdef float[::1] output_view = output_items
         cdef vector[const void*] input
         cdef vector[void*] output
+        cdef int noutput_items = len(output_items)
+        cdef int ret
         input.push_back(&input_view[0])
         output.push_back(&output_view[0])
-        return self._ptr.work(len(output_items), input, output)
+        with nogil:
+            ret = self._ptr.work(noutput_items, input, output)
+        return ret
 
     def _work2_cc(self, input_items, output_items):
         """
@@ -125,10 +167,119 @@ cdef class PLL:
         In [13]: output=np.zeros(2, dtype=np.float32)
         In [15]: pll.work(input, output)
         """
-        cdef complex64_t[:] input_view = input_items
-        cdef complex64_t[:] output_view = output_items
+        cdef complex64_t[::1] input_view = input_items
+        cdef complex64_t[::1] output_view = output_items
         cdef vector[const void*] input
         cdef vector[void*] output
+        cdef int noutput_items = len(output_items)
+        cdef int ret
         input.push_back(&input_view[0])
         output.push_back(&output_view[0])
-        return self._ptr.work2_cc(len(output_items), input, output)
+        with nogil:
+            ret = self._ptr.work2_cc(noutput_items, input, output)
+        return ret
+
+
+cdef class HilbertPLL:
+    """
+    Hilbert transform and PLL fused in one native pass (real -> float).
+
+    Equivalent to a Hilbert transform (real part delayed by ntaps//2, imaginary part by the Hilbert FIR) followed by PLL,
+    but the analytic signal is computed sample by sample inside the PLL loop, skipping the zero taps of the Hilbert filter.
+    No intermediate complex arrays are built.
+
+    Introduces a delay of ntaps//2 samples. Single-owner, like PLL.
+    """
+
+    cdef pll_freqdet_cf *_ptr
+    cdef object _taps
+    cdef object _buf
+    cdef int _end
+
+    def __cinit__(self, taps, loop_bw, max_freq, min_freq, sampling_rate):
+        """
+        :param taps:     Hilbert transform taps, see gr_firdes.firdes.hilbert(). Odd length, zero at even offsets from the center.
+        :param loop_bw:  loop bandwidth, see PLL
+        :param max_freq: maximum frequency cap (Hz)
+        :param min_freq: minimum frequency cap (Hz)
+        :param sampling_rate: sampling rate (Hz)
+        """
+        taps = np.array(taps, dtype=np.float32)  # own (writable) copy, for the typed memoryview
+        center = len(taps) // 2
+        if len(taps) % 2 != 1 or np.any(taps[center % 2::2] != 0):
+            raise ValueError('Hilbert taps must have odd length, and be zero at even offsets from the center')
+        self._taps = taps
+        self._buf = np.zeros(len(taps) - 1, dtype=np.float32)  # history, followed by the current batch
+        self._end = len(taps) - 1
+        self._ptr = make(loop_bw * 2.0*pi / sampling_rate, max_freq * 2.0*pi / sampling_rate, min_freq * 2.0*pi / sampling_rate)
+
+    def __dealloc__(self):
+        del self._ptr
+
+    property delay:
+        """delay in number of samples"""
+        def __get__(self):
+            return len(self._taps) // 2
+
+    def get_state(self):
+        """:returns dict of the loop state (see PLL.get_state()) and the input history"""
+        h = len(self._taps) - 1
+        return {'phase': self._ptr.get_phase(), 'freq': self._ptr.get_frequency(),
+                'history': self._buf[self._end - h:self._end].copy()}
+
+    def set_state(self, state):
+        """restore the state returned by get_state()"""
+        # validate before changing anything, so a bad state leaves the block untouched
+        history = np.array(state['history'], dtype=np.float32).ravel()
+        if len(history) != len(self._taps) - 1:
+            raise ValueError('history has length {}, expected {}'.format(len(history), len(self._taps) - 1))
+        phase, freq = float(state['phase']), float(state['freq'])
+        self._ptr.set_phase(phase)
+        self._ptr.set_frequency(freq)
+        self._buf = history
+        self._end = len(self._buf)
+
+    def _extend(self, x):
+        """:returns contiguous float32 buffer of the history followed by x"""
+        h, n = len(self._taps) - 1, len(self._taps) - 1 + len(x)
+        self._buf[:h] = self._buf[self._end - h:self._end]
+        if len(self._buf) < n:
+            buf = np.empty(n, dtype=np.float32)
+            buf[:h] = self._buf[:h]
+            self._buf = buf
+        self._buf[h:n] = x
+        self._end = n
+        return self._buf[:n]
+
+    def filter_ff(self, x, out=None):
+        """
+        FM demodulator (real -> float).
+        :param x: array of real numbers
+        :param out: optional contiguous float32 array of len(x), to write the output into
+        :returns: demodulated frequency values (radians per sample), as array of float numbers
+        """
+        return self._filter(x, out, False)
+
+    def filter_am_ff(self, x, out=None):
+        """
+        AM demodulator (real -> float): outputs -real(vco * analytic), see PLL.filter_cc().
+        :param x: array of real numbers
+        :param out: optional contiguous float32 array of len(x), to write the output into
+        """
+        return self._filter(x, out, True)
+
+    def _filter(self, x, out, bint am):
+        pll_out = _output_buffer(out, len(x), np.float32)
+        if len(x) == 0:
+            return pll_out
+        cdef float[::1] input_view = self._extend(x)
+        cdef float[::1] output_view = pll_out
+        cdef float[::1] taps_view = self._taps
+        cdef int noutput_items = len(x)
+        cdef int ntaps = len(self._taps)
+        with nogil:
+            if am:
+                self._ptr.work_hilbert_am(noutput_items, &input_view[0], &output_view[0], &taps_view[0], ntaps)
+            else:
+                self._ptr.work_hilbert(noutput_items, &input_view[0], &output_view[0], &taps_view[0], ntaps)
+        return pll_out
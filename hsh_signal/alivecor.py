@@ -4,30 +4,112 @@ from .filter import *
 from .signal import highpass_fft
 from .heartseries import Series, HeartSeries
 from .ecg import scrub_ecg, NoisyECG
+from .audio import WavFile
 
-import wave
+import time
+import itertools
+import multiprocessing
 import numpy as np
 
 
 class AlivecorFilter(SourceBlock):
     """Demodulates an AliveCor ECG transmitted via FM audio signal."""
-    def __init__(self, fps):
+
+    FRONTEND_BANDPASS = 1  # real band-pass filter and Hilbert transform at the audio rate
+    FRONTEND_XLATING = 2  # frequency-translating decimator to complex baseband, PLL at a reduced rate
+
+    DEMOD_PLL = 1  # phase-locked loop (sample by sample)
+    DEMOD_QUADRATURE = 2  # quadrature discriminator (vectorized)
+
+    CARRIER_BAND = (17000, 21000)  # (Hz) band of the FM carrier, roughly centered on the observed 18.8 kHz
+    CARRIER_TRANSITION_WIDTH = 500  # (Hz)
+    ECG_PASSBAND = 120  # (Hz) ECG band kept free of aliasing when decimating; the lowpass cuts off at 100 Hz
+
+    def __init__(self, fps, ecg_fps=None, frontend=FRONTEND_BANDPASS, demod=DEMOD_PLL):
+        """
+        :param fps:      audio sampling rate (Hz)
+        :param ecg_fps:  output sampling rate (Hz), an integer fraction of fps. Defaults to fps
+                         (FRONTEND_BANDPASS), or to the reduced demodulator rate (FRONTEND_XLATING).
+                         If lower, the demodulated signal is decimated (multi-rate decoding),
+                         so the narrow ECG filters run at the low output rate.
+        :param frontend: FRONTEND_BANDPASS or FRONTEND_XLATING
+        :param demod:    DEMOD_PLL or DEMOD_QUADRATURE
+        """
         super(AlivecorFilter, self).__init__()
         self.sampling_rate = fps
+        self.pll = None
+        low_freq, high_freq = self.CARRIER_BAND
+        if demod not in (AlivecorFilter.DEMOD_PLL, AlivecorFilter.DEMOD_QUADRATURE):
+            raise ValueError('invalid AlivecorFilter demod')
+
+        if frontend == AlivecorFilter.FRONTEND_BANDPASS:
+            self.ecg_sampling_rate = fps if ecg_fps is None else ecg_fps
+            self.decimation = self._decimation()
+            self.prefilter = Bandpass(low_cutoff_freq=low_freq, high_cutoff_freq=high_freq, transition_width=self.CARRIER_TRANSITION_WIDTH, sampling_rate=self.sampling_rate)
+            if demod == AlivecorFilter.DEMOD_PLL:
+                # Hilbert transform and PLL in one native pass (its output is only read by the next filter)
+                self.hilbert = None
+                self.pll = HilbertPLL(loop_bw=1500, max_freq=high_freq, min_freq=low_freq, sampling_rate=self.sampling_rate, reuse_output=True)
+                self.demod = self.pll
+                stages = [self.prefilter, self.demod]
+            else:
+                self.hilbert = Hilbert()
+                self.demod = QuadratureDemod()
+                stages = [self.prefilter, self.hilbert, self.demod]
+            demod_rate = self.sampling_rate
+        elif frontend == AlivecorFilter.FRONTEND_XLATING:
+            # largest ratio keeping the (complex) carrier band, at an integer rate that is a multiple of ecg_fps
+            min_rate = high_freq - low_freq + 2 * self.CARRIER_TRANSITION_WIDTH
+            if fps < min_rate:
+                raise ValueError('fps {} Hz is too low for FRONTEND_XLATING, the carrier band needs at least {} Hz'.format(fps, min_rate))
+            ratios = [d for d in range(1, int(fps // min_rate) + 1)
+                      if (fps / d) % 1 == 0 and (ecg_fps is None or (fps / d / ecg_fps) % 1 == 0)]
+            if not ratios:
+                raise ValueError('ecg_fps {} Hz must be an integer fraction of fps {} Hz'.format(ecg_fps, fps))
+            xlating_ratio = max(ratios)
+            demod_rate = fps / xlating_ratio
+            self.ecg_sampling_rate = demod_rate if ecg_fps is None else ecg_fps
+            self.decimation = self._decimation()
+            from gr_firdes.cache import low_pass_2
+            taps = low_pass_2(1, fps, (high_freq - low_freq) / 2.0, self.CARRIER_TRANSITION_WIDTH, 60)
+            center_freq = (low_freq + high_freq) / 2.0
+            # sample on the input grid, delayed by a whole number of output samples
+            self.prefilter = FreqXlatingDecimator(taps, xlating_ratio, center_freq, fps, phase=(len(taps) // 2) % xlating_ratio)
+            self.hilbert = None
+            if demod == AlivecorFilter.DEMOD_PLL:
+                # same loop dynamics per sample as at the audio rate (loop_bw scales with the rate)
+                self.pll = PLL(loop_bw=1500 / xlating_ratio, max_freq=high_freq - center_freq, min_freq=low_freq - center_freq, sampling_rate=demod_rate, reuse_output=True)
+            self.demod = self.pll if demod == AlivecorFilter.DEMOD_PLL else QuadratureDemod()
+            # demodulator output (radians per sample at demod_rate, relative to center_freq) -> radians per sample at fps
+            self.demod_rescale = Rescale(gain=1.0 / xlating_ratio, offset=2.0 * np.pi * center_freq / fps)
+            stages = [self.prefilter, self.demod, self.demod_rescale]
+        else:
+            raise ValueError('invalid AlivecorFilter frontend')
 
-        self.prefilter = Bandpass(low_cutoff_freq=17000, high_cutoff_freq=21000, transition_width=500, sampling_rate=self.sampling_rate)
-        self.hilbert = Hilbert()
-        # roughly center on the observed 18.8 kHz carrier
-        self.pll = PLL(loop_bw=1500, max_freq=21000, min_freq=17000, sampling_rate=self.sampling_rate)
+        self.ratio = self.decimation  # input samples per output sample, as Decimator.ratio
+
+        decimation = int(round(demod_rate / self.ecg_sampling_rate))
+        if decimation > 1:
+            self.decimator = MultistageDecimator(decimation, demod_rate, passband=self.ECG_PASSBAND, delay_in=chain_latency(stages))
+            stages.append(self.decimator)
         # remove electrical noise:
-        self.lowpass = Lowpass(cutoff_freq=100, transition_width=5, sampling_rate=self.sampling_rate)
+        self.lowpass = Lowpass(cutoff_freq=100, transition_width=5, sampling_rate=self.ecg_sampling_rate)
         # reject mains noise: (Note that for the US, you may need to change this filter to 60 Hz.)
-        self.bandreject = Bandreject(low_cutoff_freq=40, high_cutoff_freq=60, transition_width=3, sampling_rate=self.sampling_rate)
+        self.bandreject = Bandreject(low_cutoff_freq=40, high_cutoff_freq=60, transition_width=3, sampling_rate=self.ecg_sampling_rate)
         #Logger.debug('lowpass taps={}, bandreject taps={}'.format(self.lowpass._ntaps, self.bandreject._ntaps))
+        stages += [self.lowpass, self.bandreject]
+
+        self.delay = chain_latency(stages)  # in output samples
 
-        self.delay = self.prefilter.delay + self.hilbert.delay + self.lowpass.delay + self.bandreject.delay
+        connect(*stages)  #, self - but no.
+        self.stages = stages  # the chain of blocks, e.g. for running it in a pipeline.Pipeline
 
-        connect(self.prefilter, self.hilbert, self.pll, self.lowpass, self.bandreject)  #, self - but no.
+    def _decimation(self):
+        """:returns integer ratio of audio sampling rate to ECG sampling rate"""
+        decimation = int(round(self.sampling_rate / self.ecg_sampling_rate))
+        if decimation * self.ecg_sampling_rate != self.sampling_rate:
+            raise ValueError('ecg_fps must be an integer fraction of fps (and of the PLL rate)')
+        return decimation
 
     def connect(self, consumer):
         # redirect the output
@@ -36,52 +118,230 @@ class AlivecorFilter(SourceBlock):
     def put(self, x):
         self.prefilter.put(x)
 
+    def batch(self, x):
+        for stage in self.stages:
+            x = stage.batch(x)
+        return x
+
+    def latency(self, delay_in=0):
+        return chain_latency(self.stages, delay_in)
+
+    def get_state(self):
+        return {'stages': [stage.get_state() for stage in self.stages]}
 
-def decode_alivecor(signal, fps=48000, debug=False):
-    alivecor = AlivecorFilter(fps)
-    signal_padded = np.pad(signal, (0, alivecor.delay), mode='constant')  # pad with trailing zeros to force returning complete ECG
+    def set_state(self, state):
+        for stage, stage_state in zip(self.stages, state['stages']):
+            stage.set_state(stage_state)
+
+
+def decode_alivecor(signal, fps=48000, debug=False, ecg_fps=None, frontend=AlivecorFilter.FRONTEND_BANDPASS, demod=AlivecorFilter.DEMOD_PLL, out_file=None, dtype=np.float64, pipelined=False):
+    """
+    Demodulate AliveCor ECG from audio samples.
+
+    :param ecg_fps:  output sampling rate, see AlivecorFilter.
+                     Output sample k corresponds to input sample k * fps / ecg_fps.
+    :param frontend: see AlivecorFilter
+    :param demod:    see AlivecorFilter
+    :param out_file: if given, collect the ECG in this .npy file instead of in memory (see MemmapSink),
+                     and return a read-only memory-mapped view of it. The file also keeps the
+                     leading filter delay and the output of the trailing padding.
+    :param dtype:    working dtype of the filter chain. np.float32 runs the whole chain in float32/complex64,
+                     halving the memory footprint and bandwidth, at a slight loss of accuracy.
+    :param pipelined: run each filter stage in its own worker thread (see pipeline.Pipeline), to use several cores
+    """
+    alivecor = AlivecorFilter(fps, ecg_fps, frontend, demod)
+    # pad with trailing zeros to force returning complete ECG
+    signal_padded = np.pad(np.asarray(signal, dtype=dtype), (0, (alivecor.delay + 1) * alivecor.decimation), mode='constant')
     mic = ChunkDataSource(data=signal_padded, batch_size=179200, sampling_rate=fps)
-    ecg = DataSink()
+    if out_file is None:
+        ecg = DataSink(dtype=dtype, expected_length=-(-len(signal_padded) // alivecor.decimation))
+    else:
+        ecg = MemmapSink(out_file, dtype=dtype)
+    if pipelined:
+        from .pipeline import Pipeline
+        chain = Pipeline(alivecor.stages)
+    else:
+        chain = alivecor
     #mic.connect(alivecor)
     #alivecor.connect(ecg)
-    connect(mic, alivecor, ecg)
+    connect(mic, chain, ecg)
 
     # to do: use apply_filter() instead of stuff below
 
     # push through all the data
     prev_t = time.time()
     mic.start()
-    while not mic.finished():
-        if time.time() > prev_t + 1.0 and debug:
-            print 'progress: {} %'.format(mic.progress())
-            prev_t = time.time()
-        mic.poll()
-    mic.stop()
+    try:
+        while not mic.finished():
+            if time.time() > prev_t + 1.0 and debug:
+                print 'progress: {} %'.format(mic.progress())
+                prev_t = time.time()
+            mic.poll()
+    finally:
+        # also on failure, so the worker threads do not stay blocked on their queues
+        mic.stop()
+        if pipelined:
+            chain.stop()
+
+    num_out = -(-len(signal) // alivecor.decimation)  # ceil
+    if out_file is not None:
+        ecg.close()
+        return MemmapSink.load(out_file)[alivecor.delay:alivecor.delay + num_out]
+    return ecg.view()[alivecor.delay:alivecor.delay + num_out]  # cut off leading filter delay (contains nonsense output)
+
+
+def decode_alivecor_stream(chunks, fps=48000, ecg_fps=300, frontend=AlivecorFilter.FRONTEND_BANDPASS, demod=AlivecorFilter.DEMOD_PLL, dtype=np.float64):
+    """
+    Streaming variant of decode_alivecor(): demodulate AliveCor ECG from audio arriving in chunks.
+
+    Memory use does not depend on the recording length, and ECG blocks are yielded while the input is still being read.
+    The filter delay is compensated: concatenated, the yielded blocks equal decode_alivecor() of the concatenated chunks.
+
+    :param chunks:   iterable of audio sample arrays
+    :param ecg_fps:  output sampling rate, see AlivecorFilter
+    :returns generator of ECG arrays
+    """
+    alivecor = AlivecorFilter(fps, ecg_fps, frontend, demod)
+    ecg = BatchSink()
+    connect(alivecor, ecg)
+    skip = alivecor.delay  # leading output samples still to cut off
+    num_in, num_out, num_yielded = 0, None, 0
+
+    for x in itertools.chain(chunks, [None]):
+        if x is None:
+            # end of input: pad with trailing zeros to force returning complete ECG
+            x = np.zeros((alivecor.delay + 1) * alivecor.decimation)
+            num_out = -(-num_in // alivecor.decimation)  # ceil
+        else:
+            num_in += len(x)
+        if len(x) == 0:
+            continue
+        alivecor.put(np.asarray(x, dtype=dtype))
 
-    return ecg.data[alivecor.delay:]  # cut off leading filter delay (contains nonsense output)
+        for y in ecg.take():
+            y, skip = y[skip:], max(0, skip - len(y))  # cut off leading filter delay (contains nonsense output)
+            if num_out is not None:
+                y = y[:num_out - num_yielded]
+            if len(y) > 0:
+                num_yielded += len(y)
+                yield y
 
 
-def load_raw_audio(file_name):
-    """Returns (sampling_rate, samples) where samples is an array of floats"""
-    wf = wave.open(file_name)
-    nframes = wf.getnframes()
-    buf = wf.readframes(nframes)
-    arr = np.frombuffer(buf, dtype=np.int16)
-    arr = arr.reshape((nframes, wf.getnchannels())).T
+def decode_alivecor_file(file_name, ecg_fps=300, batch_size=179200, offset=0.0, duration=None, **kwargs):
+    """
+    Streaming AliveCor ECG decoder reading a WAV file in batches (left channel if stereo), see decode_alivecor_stream().
 
-    assert(wf.getsampwidth() == 2)  # for np.int16 to hold
-    #assert(wf.getframerate() == 48000)  # Android recs 48 kHz?!
+    :param batch_size: number of audio samples read and converted at a time
+    :param offset:     start of the time window (seconds)
+    :param duration:   length of the time window (seconds), defaults to the rest of the file
+    :param kwargs:     frontend, demod, dtype, see decode_alivecor_stream()
+    :returns generator of ECG arrays at ecg_fps
+    """
+    wav = WavFile(file_name)
+    audio = wav.lazy_samples(0, offset, duration, kwargs.get('dtype', np.float64))
+    chunks = (audio[i:i+batch_size] for i in range(0, len(audio), batch_size))
+    return decode_alivecor_stream(chunks, wav.sampling_rate, ecg_fps, **kwargs)
 
-    raw_audio = arr[0] / float(2**15)  # assuming 16-bit wav file, left if stereo
-    return raw_audio, wf.getframerate()
+
+def _decode_alivecor_segment(args):
+    """decode_alivecor() of one segment, for the process pool of decode_alivecor_parallel()"""
+    signal, fps, ecg_fps, kwargs = args
+    return decode_alivecor(signal, fps=fps, ecg_fps=ecg_fps, **kwargs)
+
+
+def decode_alivecor_parallel(signal, fps=48000, ecg_fps=300, segment_duration=60.0, lockin_duration=0.5, processes=None, **kwargs):
+    """
+    Segment-parallel variant of decode_alivecor(), to use several cores for one long recording.
+
+    The audio is split into segments, which are decoded in a process pool. Each segment is extended by overlapping margins:
+    on the left, by the filter warm-up (delay) and the PLL lock-in time, on the right, by the filter delay.
+    Segments start on multiples of the decimation ratio, so the stitched output is sample-aligned with decode_alivecor().
+    Since each PLL locks on independently, the output only matches the serial decoding where the carrier is present.
+
+    :param ecg_fps:          output sampling rate, see AlivecorFilter
+    :param segment_duration: length of the output part of each segment (seconds)
+    :param lockin_duration:  margin for the PLL to lock on, before the output part of each segment (seconds)
+    :param processes:        number of worker processes, defaults to the number of CPUs
+    :param kwargs:           frontend, demod, dtype, see decode_alivecor()
+    :raises ValueError: for other decode_alivecor() arguments (out_file, pipelined, debug), which do not apply per segment
+    """
+    unsupported = sorted(set(kwargs) - set(['frontend', 'demod', 'dtype']))
+    if unsupported:
+        # every worker would write the same out_file, or start its own pipeline threads
+        raise ValueError('decode_alivecor_parallel() does not support {}'.format(', '.join(unsupported)))
+    alivecor = AlivecorFilter(fps, ecg_fps, kwargs.get('frontend', AlivecorFilter.FRONTEND_BANDPASS), kwargs.get('demod', AlivecorFilter.DEMOD_PLL))
+    decimation = alivecor.decimation
+    num_out = -(-len(signal) // decimation)  # ceil
+    left_margin = alivecor.delay + int(np.ceil(lockin_duration * alivecor.ecg_sampling_rate))  # in output samples
+    right_margin = alivecor.delay + 1
+    segment_len = max(1, int(round(segment_duration * alivecor.ecg_sampling_rate)))
+
+    # output ranges [out_start, out_end) and the (longer) output ranges decoded for them, on the input sample grid
+    segments = []
+    for out_start in range(0, num_out, segment_len):
+        out_end = min(out_start + segment_len, num_out)
+        dec_start = max(0, out_start - left_margin)
+        segments.append((out_start, out_end, dec_start, signal[dec_start * decimation:(out_end + right_margin) * decimation]))
+
+    jobs = [(seg, fps, ecg_fps, kwargs) for _, _, _, seg in segments]
+    if len(jobs) > 1 and processes != 1:
+        pool = multiprocessing.Pool(processes)
+        try:
+            decoded = pool.map(_decode_alivecor_segment, jobs)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        decoded = [_decode_alivecor_segment(job) for job in jobs]
+
+    ecg = np.zeros(num_out, dtype=decoded[0].dtype if decoded else np.float64)
+    for (out_start, out_end, dec_start, _), ecg_segment in zip(segments, decoded):
+        ecg[out_start:out_end] = ecg_segment[out_start - dec_start:out_end - dec_start]
+    return ecg
+
+
+def load_raw_audio(file_name, dtype=np.float64, offset=0.0, duration=None):
+    """
+    Returns (samples, sampling_rate) where samples is an array of floats (left channel if stereo)
+
+    Only the requested window is read from the memory-mapped file (see audio.WavFile).
+
+    :param dtype:    float dtype of the samples, e.g. np.float32 for decode_alivecor(..., dtype=np.float32)
+    :param offset:   start of the time window (seconds)
+    :param duration: length of the time window (seconds), defaults to the rest of the file
+    """
+    wav = WavFile(file_name)
+    return wav.samples(0, offset, duration, dtype), wav.sampling_rate
 
 
 def beatdet_alivecor(signal, fps=48000, lpad_t=0):
     """decode, scrub, and beatdetect AliveCor."""
     #print 'ecg_fps=', ecg_fps
-    ecg_raw = decode_alivecor(signal, fps=fps)
     ecg_dec_fps = 300
-    ecg = ecg_raw[::int(fps/ecg_dec_fps)]
+    if fps % ecg_dec_fps == 0:
+        ecg = decode_alivecor(signal, fps=fps, ecg_fps=ecg_dec_fps)  # multi-rate decoding
+    else:
+        ecg_raw = decode_alivecor(signal, fps=fps)
+        ecg = ecg_raw[::int(fps/ecg_dec_fps)]
+    return _beatdet_decoded(ecg, ecg_dec_fps, lpad_t)
+
+
+def beatdet_alivecor_file(file_name, lpad_t=0):
+    """
+    decode, scrub, and beatdetect AliveCor from a WAV file, see beatdet_alivecor().
+
+    Decodes while streaming the file (see decode_alivecor_file()), instead of loading the whole audio into memory.
+    """
+    ecg_dec_fps = 300
+    if WavFile(file_name).sampling_rate % ecg_dec_fps != 0:
+        signal, fps = load_raw_audio(file_name)
+        return beatdet_alivecor(signal, fps, lpad_t)
+    ecg = np.concatenate([np.zeros(0)] + list(decode_alivecor_file(file_name, ecg_fps=ecg_dec_fps)))
+    return _beatdet_decoded(ecg, ecg_dec_fps, lpad_t)
+
+
+def _beatdet_decoded(ecg, ecg_dec_fps, lpad_t):
+    """scrub and beatdetect decoded AliveCor ECG"""
     ecg = highpass_fft(ecg, fps=ecg_dec_fps)
     ecg = Series(ecg, fps=ecg_dec_fps, lpad=lpad_t*ecg_dec_fps)
 
@@ -13,16 +13,19 @@ class _AMDemod(FilterBlock):
         You must use a low-pass afterwards, since this still contains frequency components from both sides.
         """
         super(_AMDemod, self).__init__()
-        self.hilbert = Hilbert(ntaps)
-        self.pll = PLL(loop_bw, max_freq, min_freq, sampling_rate)
-        self.delay = self.hilbert.delay
+        # Hilbert, PLL and multiply in one native pass (its output is only read by the lowpass of AMFilter)
+        self.pll = HilbertPLL(loop_bw, max_freq, min_freq, sampling_rate, ntaps, am=True, reuse_output=True)
+        self.delay = self.pll.delay
 
     def batch(self, x):
         """batch-process an array and return array of output values"""
-        analytic = self.hilbert.batch(x)
-        carrier = self.pll.batch_vco(analytic)
-        demod = -np.real(carrier * analytic)
-        return demod
+        return self.pll.batch(x)
+
+    def get_state(self):
+        return self.pll.get_state()
+
+    def set_state(self, state):
+        self.pll.set_state(state)
 
 
 class AMFilter(SourceBlock):
@@ -39,9 +42,10 @@ class AMFilter(SourceBlock):
         self.demod = _AMDemod(loop_bw=loop_bw, max_freq=max_freq, min_freq=min_freq, sampling_rate=self.sampling_rate)
         self.lowpass = Lowpass(cutoff_freq=100, transition_width=5, sampling_rate=self.sampling_rate)
 
-        self.delay = self.prefilter.delay + self.demod.delay + self.lowpass.delay
+        self.stages = [self.prefilter, self.demod, self.lowpass]
+        self.delay = chain_latency(self.stages)
 
-        connect(self.prefilter, self.demod, self.lowpass)
+        connect(*self.stages)
 
     def connect(self, consumer):
         # redirect the output
@@ -49,3 +53,13 @@ class AMFilter(SourceBlock):
 
     def put(self, x):
         self.prefilter.put(x)
+
+    def batch(self, x):
+        return self.lowpass.batch(self.demod.batch(self.prefilter.batch(x)))
+
+    def get_state(self):
+        return {'stages': [stage.get_state() for stage in self.stages]}
+
+    def set_state(self, state):
+        for stage, stage_state in zip(self.stages, state['stages']):
+            stage.set_state(stage_state)
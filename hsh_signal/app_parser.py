@@ -9,7 +9,7 @@ import glob
 from collections import defaultdict
 
 from .pickling import load_zipped_pickle
-from .alivecor import decode_alivecor, beatdet_alivecor, load_raw_audio
+from .alivecor import decode_alivecor, beatdet_alivecor, beatdet_alivecor_file, load_raw_audio
 from .signal import evenly_resample, grid_resample, highpass
 from .heartseries import Series
 from .ppg import ppg_beatdetect_brueser, ppg_beatdetect_getrr, beatdet_getrr_v2
@@ -419,9 +419,8 @@ class AppData:
             return np.load(cache_file)
 
         audio_base = os.path.join(os.path.dirname(self.meta_filename), 'audio')
-        raw_sig, fps = load_raw_audio(audio_filename(audio_base, self.meta_data))
         self.series_data.load()
-        ecg = beatdet_alivecor(raw_sig, fps)
+        ecg = beatdet_alivecor_file(audio_filename(audio_base, self.meta_data))
 
         if os.path.isdir(AppData.CACHE_DIR):
             with open(cache_file, 'wb') as fo:
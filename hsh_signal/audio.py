@@ -0,0 +1,140 @@
+"""
+Memory-mapped WAV file access.
+
+The data chunk of a 16-bit PCM WAV file is memory-mapped, and a channel is a strided int16 view into it:
+nothing is read from disk until samples are accessed, and only the accessed range is.
+Conversion to float happens lazily, per chunk of samples (see ScaledArray).
+"""
+
+from __future__ import division
+
+import struct
+
+import numpy as np
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# SubFormat GUID of WAVE_FORMAT_EXTENSIBLE for PCM data (KSDATAFORMAT_SUBTYPE_PCM), as stored in the file
+KSDATAFORMAT_SUBTYPE_PCM = b'\x01\x00\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+
+class WavFile(object):
+    """
+    16-bit PCM WAV file, with its data chunk memory-mapped.
+
+    Usage:
+        wav = WavFile('audio.wav')
+        raw = wav.channel(0, offset=10.0, duration=5.0)  # int16 view, nothing read yet
+        x = wav.samples(0, offset=10.0, duration=5.0)  # float array of the same window
+    """
+    def __init__(self, file_name):
+        """
+        :raises EOFError:   for empty or truncated headers (e.g. 0-byte transmissions)
+        :raises ValueError: for files that are not 16-bit PCM WAV
+        """
+        self.file_name = file_name
+        self._data_offset, self._data_size = None, None
+        with open(file_name, 'rb') as f:
+            riff = f.read(12)
+            if len(riff) < 12:
+                raise EOFError('{}: truncated RIFF header'.format(file_name))
+            if riff[0:4] != b'RIFF' or riff[8:12] != b'WAVE':
+                raise ValueError('{}: not a RIFF WAVE file'.format(file_name))
+            fmt = None
+            while self._data_offset is None:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    raise EOFError('{}: no data chunk'.format(file_name))
+                chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size)
+                    f.seek(chunk_size % 2, 1)  # chunks are padded to even sizes
+                elif chunk_id == b'data':
+                    self._data_offset, self._data_size = f.tell(), chunk_size
+                else:
+                    f.seek(chunk_size + chunk_size % 2, 1)
+            f.seek(0, 2)
+            file_size = f.tell()
+
+        if fmt is None or len(fmt) < 16:
+            raise ValueError('{}: missing fmt chunk'.format(file_name))
+        format_tag, self.num_channels, self.sampling_rate, _byte_rate, _block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+        if format_tag == WAVE_FORMAT_EXTENSIBLE:
+            # the actual format is given by the extension: cbSize, valid bits per sample, channel mask, SubFormat GUID
+            if len(fmt) < 40 or struct.unpack('<H', fmt[16:18])[0] < 22:
+                raise ValueError('{}: truncated WAVE_FORMAT_EXTENSIBLE fmt chunk'.format(file_name))
+            valid_bits, _channel_mask, sub_format = struct.unpack('<HI16s', fmt[18:40])
+            if sub_format != KSDATAFORMAT_SUBTYPE_PCM:
+                raise ValueError('{}: only 16-bit PCM supported, got WAVE_FORMAT_EXTENSIBLE with a non-PCM SubFormat'.format(file_name))
+            if bits != 16 or valid_bits != 16:
+                raise ValueError('{}: only 16-bit PCM supported, got {} valid bits of {}'.format(file_name, valid_bits, bits))
+        elif format_tag != WAVE_FORMAT_PCM or bits != 16:
+            raise ValueError('{}: only 16-bit PCM supported, got format {} with {} bits'.format(file_name, format_tag, bits))
+        self.sample_width = 2
+        self._frame_size = self.num_channels * self.sample_width
+        # recorders that were interrupted leave a wrong data size: trust the file size, and ignore a partial last frame
+        data_size = min(self._data_size, file_size - self._data_offset)
+        self.num_frames = data_size // self._frame_size
+
+    @property
+    def duration(self):
+        """duration in seconds"""
+        return self.num_frames / self.sampling_rate
+
+    def _frame_range(self, offset, duration):
+        start = min(int(round(offset * self.sampling_rate)), self.num_frames)
+        stop = self.num_frames if duration is None else min(start + int(round(duration * self.sampling_rate)), self.num_frames)
+        return start, stop
+
+    def channel(self, channel=0, offset=0.0, duration=None):
+        """
+        :param channel:  channel index (0 = left if stereo)
+        :param offset:   start of the time window (seconds)
+        :param duration: length of the time window (seconds), defaults to the rest of the file
+        :returns read-only strided int16 view of one channel, memory-mapped (only the window is mapped)
+        """
+        if not 0 <= channel < self.num_channels:
+            raise ValueError('channel {} out of range, file has {} channels'.format(channel, self.num_channels))
+        start, stop = self._frame_range(offset, duration)
+        if stop == start:
+            return np.zeros(0, dtype='<i2')
+        frames = np.memmap(self.file_name, dtype='<i2', mode='r', offset=self._data_offset + start * self._frame_size,
+                           shape=(stop - start, self.num_channels))
+        return frames[:, channel]
+
+    def lazy_samples(self, channel=0, offset=0.0, duration=None, dtype=np.float64):
+        """:returns ScaledArray converting the channel() view to floats in [-1, 1) on access"""
+        return ScaledArray(self.channel(channel, offset, duration), 1.0 / 2**15, dtype)
+
+    def samples(self, channel=0, offset=0.0, duration=None, dtype=np.float64):
+        """:returns float array in [-1, 1) of one channel in the time window (see channel())"""
+        return self.lazy_samples(channel, offset, duration, dtype)[:]
+
+
+class ScaledArray(object):
+    """
+    Array-like view of an integer array that is converted to floats (scaled) only when sliced.
+
+    Can be passed as data to ChunkDataSource, to convert one batch at a time.
+    """
+    def __init__(self, raw, scale, dtype=np.float64):
+        self.raw = raw
+        self.scale = scale
+        self.dtype = np.dtype(dtype)
+
+    def __len__(self):
+        return len(self.raw)
+
+    @property
+    def shape(self):
+        return self.raw.shape
+
+    def __getitem__(self, item):
+        x = np.asarray(self.raw[item]).astype(self.dtype)
+        x *= self.scale
+        return x
+
+    def __array__(self, dtype=None):
+        x = self[:]
+        return x if dtype is None else x.astype(dtype, copy=False)
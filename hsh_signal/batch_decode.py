@@ -0,0 +1,98 @@
+"""
+Batch AliveCor decoder: decode and beatdetect many WAV files in a process pool.
+
+Usage:
+    python -m hsh_signal.batch_decode recordings/ -o ecg/
+    python -m hsh_signal.batch_decode 'recordings/*/audio*.wav' -o ecg/ -j 8
+
+Each input file a.wav results in a HeartSeries pickle ecg/a_ecg.b (see Series.load()).
+Files whose output already exists are skipped, so an interrupted run can simply be restarted.
+"""
+
+from __future__ import division, print_function
+
+import os
+import sys
+import glob
+import time
+import argparse
+import traceback
+import multiprocessing
+
+from .alivecor import beatdet_alivecor_file
+from .audio import WavFile
+
+
+def find_wav_files(inputs):
+    """:returns sorted list of WAV files from directories (*.wav inside) and glob patterns"""
+    files = set()
+    for inp in inputs:
+        if os.path.isdir(inp):
+            files.update(glob.glob(os.path.join(inp, '*.wav')))
+        else:
+            files.update(glob.glob(inp))
+    return sorted(files)
+
+
+def output_filename(wav_file, out_dir):
+    return os.path.join(out_dir, os.path.splitext(os.path.basename(wav_file))[0] + '_ecg.b')
+
+
+def decode_file(args):
+    """
+    Worker: decode and beatdetect one file, and dump the resulting HeartSeries.
+
+    :returns (wav_file, audio duration in seconds, error message or None)
+    """
+    wav_file, out_file = args
+    try:
+        duration = WavFile(wav_file).duration
+        ecg = beatdet_alivecor_file(wav_file)
+        # write to a temporary file and rename it, so an interrupted run never leaves a partial output
+        tmp_file = out_file + '.tmp{}'.format(os.getpid())
+        ecg.dump(tmp_file)
+        os.rename(tmp_file, out_file)
+        return wav_file, duration, None
+    except Exception:
+        return wav_file, 0.0, traceback.format_exc()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Decode and beatdetect AliveCor ECG from WAV files.')
+    parser.add_argument('inputs', nargs='+', help='directories of .wav files, or glob patterns of files')
+    parser.add_argument('-o', '--out-dir', required=True, help='output directory for the HeartSeries pickles')
+    parser.add_argument('-j', '--processes', type=int, default=None, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('-f', '--force', action='store_true', help='decode again, even if the output exists')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.out_dir):
+        os.makedirs(args.out_dir)
+    wav_files = find_wav_files(args.inputs)
+    jobs = [(f, output_filename(f, args.out_dir)) for f in wav_files]
+    if not args.force:
+        jobs = [(f, o) for f, o in jobs if not os.path.exists(o)]
+    print('{} files, {} to decode'.format(len(wav_files), len(jobs)))
+
+    start = time.time()
+    audio_seconds, failures = 0.0, 0
+    pool = multiprocessing.Pool(args.processes)
+    try:
+        for i, (wav_file, duration, error) in enumerate(pool.imap_unordered(decode_file, jobs)):
+            if error is None:
+                audio_seconds += duration
+                print('[{}/{}] {} ({:.1f} s)'.format(i + 1, len(jobs), wav_file, duration))
+            else:
+                failures += 1
+                print('[{}/{}] FAILED {}:\n{}'.format(i + 1, len(jobs), wav_file, error), file=sys.stderr)
+    finally:
+        pool.close()
+        pool.join()
+
+    elapsed = time.time() - start
+    print('decoded {:.1f} s of audio in {:.1f} s ({:.1f} audio-seconds per second), {} failed'.format(
+        audio_seconds, elapsed, audio_seconds / max(elapsed, 1e-9), failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Flowgraphs of FilterBlock objects: one source block, fan-out to several branches and sinks.
+
+connect() wires a linear push chain, and Splitter fans out by hand, with the delays summed up manually.
+A Flowgraph instead knows the whole graph: it validates it, runs the blocks in topological order (via batch(),
+so a block feeding several branches runs once per batch), computes the latency at each sink (see
+FilterBlock.latency()) and cuts off the leading filter transients, so the samples arriving at every sink
+are aligned with the source signal.
+
+Usage:
+    graph = Flowgraph()
+    graph.connect(bandpass, hilbert, pll)
+    graph.connect(pll, audio_sink)
+    graph.connect(pll, decimator, lowpass, ecg_sink)
+    graph.run(signal)  # or graph.put() batches as they arrive, e.g. connect(mic, graph)
+"""
+
+from __future__ import division, print_function
+
+import time
+
+import numpy as np
+
+from .filter import FilterBlock, SinkBlock, RegroupBatches, working_dtype
+
+
+class FlowgraphError(ValueError):
+    """The graph is not a valid flowgraph."""
+    pass
+
+
+class _SinkPort(object):
+    """Feeds a sink, dropping the leading transient samples and, after run(), the output of the trailing padding."""
+    def __init__(self, sink, skip):
+        self.sink = sink
+        self.skip = skip  # leading samples still to drop
+        self.remaining = None  # samples still to pass on, None = unlimited
+
+    def put(self, x):
+        if self.skip > 0:
+            n = min(self.skip, len(x))
+            x, self.skip = x[n:], self.skip - n
+        if self.remaining is not None:
+            x = x[:self.remaining]
+            self.remaining -= len(x)
+        if len(x) > 0:
+            self.sink.put(x)
+
+
+def _defining_class(cls, attr):
+    """:returns the class in the MRO of cls that defines attr"""
+    for c in cls.__mro__:
+        if attr in c.__dict__:
+            return c
+
+
+def _check_batch(block):
+    """:raises FlowgraphError if the flowgraph cannot run block via batch()"""
+    name = type(block).__name__
+    if not isinstance(block, FilterBlock):
+        raise FlowgraphError('{} is not a FilterBlock, it cannot be run via batch()'.format(name))
+    if isinstance(block, RegroupBatches):
+        # its batch() passes the input through, the regrouping only happens in put()
+        raise FlowgraphError('{} regroups batches in put(), it cannot be run in a flowgraph'.format(name))
+    # a put() override more derived than batch() does its own processing (e.g. RegroupBatches,
+    # or a composite pushing through connect()ed stages), which batch() would silently bypass
+    put_class, batch_class = _defining_class(type(block), 'put'), _defining_class(type(block), 'batch')
+    if put_class is not FilterBlock and issubclass(put_class, batch_class) and put_class is not batch_class:
+        raise FlowgraphError('{} overrides put() but not batch(), it cannot be run in a flowgraph'.format(name))
+
+
+class Flowgraph(SinkBlock):
+    """
+    Directed acyclic graph of FilterBlock objects with a single source block, run batch by batch.
+
+    Inner blocks are run via batch(), and must not be connected to consumers themselves; blocks doing their
+    processing in put() (e.g. RegroupBatches, Pipeline, Splitter) are rejected.
+    The leaves must be SinkBlock objects (e.g. DataSink, or another Flowgraph).
+    """
+    def __init__(self, trim=True):
+        """:param trim: cut off the leading latency() samples at each sink (filter transients)"""
+        super(Flowgraph, self).__init__()
+        self.trim = trim
+        self._blocks = []  # in insertion order
+        self._successors = {}
+        self._predecessors = {}
+        self._order = None  # topological order, after validate()
+
+    def connect(self, *blocks):
+        """add a chain of blocks to the graph (blocks already in the graph are reused, so chains can branch off)"""
+        for block in blocks:
+            if block not in self._successors:
+                self._blocks.append(block)
+                self._successors[block], self._predecessors[block] = [], []
+        for a, b in zip(blocks[:-1], blocks[1:]):
+            if b in self._successors[a]:
+                raise FlowgraphError('duplicate edge {} -> {}'.format(type(a).__name__, type(b).__name__))
+            self._successors[a].append(b)
+            self._predecessors[b].append(a)
+        self._order = None
+
+    def validate(self):
+        """
+        Check the graph, and compute the schedule and the latency at each block.
+
+        :raises FlowgraphError: for empty or cyclic graphs, several sources, fan-in, or leaves that are not sinks
+        """
+        if not self._blocks:
+            raise FlowgraphError('empty flowgraph')
+        sources = [b for b in self._blocks if not self._predecessors[b]]
+        if len(sources) != 1:
+            raise FlowgraphError('flowgraph needs exactly one source block, got {}'.format(len(sources)))
+        for block in self._blocks:
+            name = type(block).__name__
+            if len(self._predecessors[block]) > 1:
+                raise FlowgraphError('{} has several inputs, fan-in is not supported'.format(name))
+            if self._successors[block] and isinstance(block, SinkBlock):
+                raise FlowgraphError('sink {} cannot feed other blocks'.format(name))
+            if not self._successors[block] and not isinstance(block, SinkBlock):
+                raise FlowgraphError('{} has no consumer, leaves must be SinkBlock objects'.format(name))
+            if self._successors[block]:
+                _check_batch(block)
+
+        # with a single source and a single input per block, the graph is a tree:
+        # a breadth-first walk from the source visits every block after its input (topological order)
+        order, queue = [], list(sources)
+        while queue:
+            block = queue.pop(0)
+            order.append(block)
+            queue.extend(self._successors[block])
+        if len(order) != len(self._blocks):
+            raise FlowgraphError('flowgraph contains a cycle')
+
+        self._latency, self._ratio = {}, {}
+        for block in order:
+            pred = self._predecessors[block]
+            if isinstance(block, SinkBlock):
+                # sinks only collect their input
+                self._latency[block], self._ratio[block] = self._latency[pred[0]], self._ratio[pred[0]]
+            else:
+                delay_in, ratio_in = (self._latency[pred[0]], self._ratio[pred[0]]) if pred else (0, 1)
+                self._latency[block] = block.latency(delay_in)
+                self._ratio[block] = ratio_in * getattr(block, 'ratio', 1)
+        self._ports = dict((sink, _SinkPort(sink, int(np.ceil(self._latency[sink])) if self.trim else 0))
+                           for sink in self.sinks)
+        self._order = order
+
+    @property
+    def blocks(self):
+        """all blocks, sinks included, in insertion order"""
+        return list(self._blocks)
+
+    @property
+    def source(self):
+        return [b for b in self._blocks if not self._predecessors[b]][0]
+
+    @property
+    def sinks(self):
+        return [b for b in self._blocks if not self._successors[b]]
+
+    def latency(self, block=None):
+        """
+        :param block: a block in the graph, defaults to the only sink
+        :returns latency of the block output relative to the source signal, in output samples (see FilterBlock.latency()).
+                 For a sink, the leading samples cut off if trim is set (rounded up).
+        """
+        if self._order is None:
+            self.validate()
+        if block is None:
+            sinks = self.sinks
+            if len(sinks) != 1:
+                raise ValueError('flowgraph has {} sinks, specify one'.format(len(sinks)))
+            block = sinks[0]
+        return self._latency[block]
+
+    def ratio(self, block):
+        """:returns number of source samples per output sample of the block"""
+        if self._order is None:
+            self.validate()
+        return self._ratio[block]
+
+    def put(self, x):
+        """run a batch through all blocks, each block once, and put the results to the sinks"""
+        if self._order is None:
+            self.validate()
+        outputs = {}
+        for block in self._order:
+            pred = self._predecessors[block]
+            y = outputs[pred[0]] if pred else x
+            if block in self._ports:
+                self._ports[block].put(y)
+            else:
+                outputs[block] = block.batch(y)
+
+    def run(self, signal, batch_size=179200, dtype=None, debug=False):
+        """
+        Push a whole signal through the graph, compensating the latencies.
+
+        The signal is padded with trailing zeros, and each sink gets exactly ceil(len(signal) / ratio) samples
+        (plus the leading latency, if not trim), with output sample k corresponding to signal sample k * ratio.
+
+        :param dtype: working dtype, e.g. np.float32 for single precision processing. Defaults to the working_dtype() of signal.
+        """
+        if self._order is None:
+            self.validate()
+        signal = np.asarray(signal, dtype=working_dtype(signal) if dtype is None else dtype)
+        pad = 0
+        for sink, port in self._ports.items():
+            ratio, head = self._ratio[sink], int(np.ceil(self._latency[sink]))
+            port.remaining = -(-len(signal) // ratio) + (0 if self.trim else head)
+            pad = max(pad, (head + 2) * ratio)
+        signal_padded = np.concatenate([signal, np.zeros(pad, dtype=signal.dtype)])
+
+        prev_t = time.time()
+        for i in range(0, len(signal_padded), batch_size):
+            if debug and time.time() > prev_t + 1.0:
+                print('progress: {} %'.format(100.0 * i / len(signal_padded)))
+                prev_t = time.time()
+            self.put(signal_padded[i:i+batch_size])
+        for port in self._ports.values():
+            port.remaining = None
+
+    def get_state(self):
+        if self._order is None:
+            self.validate()
+        return {'blocks': [block.get_state() for block in self._order],
+                'skip': [self._ports[sink].skip for sink in self.sinks]}
+
+    def set_state(self, state):
+        if self._order is None:
+            self.validate()
+        for block, block_state in zip(self._order, state['blocks']):
+            block.set_state(block_state)
+        for sink, skip in zip(self.sinks, state['skip']):
+            self._ports[sink].skip = skip
@@ -0,0 +1,180 @@
+"""
+asyncio interface for live capture: async sources, awaitable sinks, and a runner driving a filter graph.
+
+ChunkDataSource.poll() must be called from an external timer (e.g. the kivy clock), blocking it while the
+filters run. An AsyncRunner instead awaits the batches of an AsyncSource, runs the filter graph in an executor
+(the numpy/FFT work and the native PLL release the GIL), and awaits the delivery of the results to AsyncSink
+objects, so the event loop stays responsive and one process can serve many concurrent streams.
+
+Usage:
+    source, ecg = QueueSource(maxsize=8), QueueSink()
+    graph = Flowgraph()
+    graph.connect(AlivecorFilter(48000, ecg_fps=300), ecg)
+    stream = asyncio.ensure_future(AsyncRunner(source, graph).run())  # done at the end of the stream
+    ...
+    await source.write(audio)  # e.g. from a websocket handler
+    x = await ecg.get()  # next ECG batch, None at the end of the stream
+
+Requires Python 3.7 (native coroutines, asyncio.get_running_loop()), unlike the rest of the package.
+Python 2 cannot byte-compile this module: setup.py leaves it out of Python 2 builds.
+"""
+
+import asyncio
+
+import numpy as np
+
+from .filter import SinkBlock
+
+
+class AsyncSource(object):
+    """Source of sample batches (audio, camera frames, ...) for an AsyncRunner."""
+    async def read(self):
+        """:returns the next batch, or None at the end of the stream"""
+        raise NotImplementedError("override me: AsyncSource.read()")
+
+    def start(self): pass
+    def stop(self): pass
+
+
+class QueueSource(AsyncSource):
+    """Source fed by a producer coroutine or callback, e.g. a network handler, through an asyncio.Queue."""
+    def __init__(self, maxsize=0):
+        """:param maxsize: max. number of batches waiting, 0 for unbounded. write() waits while the queue is full."""
+        self._queue = asyncio.Queue(maxsize)
+
+    async def read(self):
+        return await self._queue.get()
+
+    async def write(self, x):
+        """queue a batch, waiting while the queue is full"""
+        await self._queue.put(x)
+
+    def write_nowait(self, x):
+        """queue a batch without waiting, :raises asyncio.QueueFull"""
+        self._queue.put_nowait(x)
+
+    async def close(self):
+        """queue the end of the stream"""
+        await self._queue.put(None)
+
+
+class ReplaySource(AsyncSource):
+    """
+    Replays recorded samples batch by batch, like ChunkDataSource, optionally at the pace of a live capture.
+    """
+    def __init__(self, data, batch_size, sampling_rate=44100, realtime=True):
+        """:param realtime: deliver each batch only when it would have been captured live"""
+        self.sampling_rate = sampling_rate
+        self.realtime = realtime
+        self._data = data
+        self._batch_size = batch_size
+        self._i = 0
+        self._start_time = None
+
+    async def read(self):
+        loop = asyncio.get_running_loop()
+        if self._start_time is None:
+            self._start_time = loop.time()
+        if self._i >= len(self._data):
+            return None
+        x = self._data[self._i:self._i+self._batch_size]
+        self._i += len(x)
+        # pace by the capture time of the batch end, so delays do not accumulate
+        delay = self._start_time + self._i / self.sampling_rate - loop.time() if self.realtime else 0
+        await asyncio.sleep(max(delay, 0))
+        return x
+
+
+class AsyncSink(SinkBlock):
+    """
+    Sink collecting the graph output in the executor thread, to be delivered by deliver() on the event loop.
+
+    Override deliver() (and close()) for asynchronous consumers.
+    """
+    def __init__(self):
+        super(AsyncSink, self).__init__()
+        self._pending = []
+
+    def put(self, x):
+        # copy, since blocks may reuse their output buffers (see the reuse_output option of PLL)
+        self._pending.append(np.array(x))
+
+    def take(self):
+        """:returns list of the batches put since the last call"""
+        batches, self._pending = self._pending, []
+        return batches
+
+    async def deliver(self, x):
+        """hand a batch to the consumer, waiting while it cannot take more"""
+        raise NotImplementedError("override me: AsyncSink.deliver()")
+
+    async def close(self):
+        """end of the stream"""
+        pass
+
+
+class QueueSink(AsyncSink):
+    """Sink handing the batches to a consumer coroutine through an asyncio.Queue."""
+    def __init__(self, maxsize=0):
+        """:param maxsize: max. number of batches waiting, 0 for unbounded. A full queue stalls the stream (backpressure)."""
+        super(QueueSink, self).__init__()
+        self._queue = asyncio.Queue(maxsize)
+
+    async def deliver(self, x):
+        await self._queue.put(x)
+
+    async def close(self):
+        await self._queue.put(None)
+
+    async def get(self):
+        """:returns the next batch, or None at the end of the stream"""
+        return await self._queue.get()
+
+    def get_nowait(self):
+        """:returns next batch, None at the end of the stream, :raises asyncio.QueueEmpty"""
+        return self._queue.get_nowait()
+
+
+class AsyncRunner(object):
+    """
+    Drives a filter graph from an AsyncSource, without blocking the event loop.
+
+    Each batch is run through the graph in the executor, one batch at a time per stream (the blocks are stateful),
+    while other streams and coroutines keep running. Afterwards, the AsyncSink outputs are delivered, in order.
+    """
+    def __init__(self, source, graph, sinks=None, executor=None):
+        """
+        :param source:   AsyncSource
+        :param graph:    block whose put() runs a batch through all blocks, e.g. a flowgraph.Flowgraph,
+                         or the first block of a connect()ed chain
+        :param sinks:    AsyncSink objects in the graph, defaults to those among graph.sinks (Flowgraph)
+        :param executor: concurrent.futures executor running the graph, defaults to the event loop's default executor
+        """
+        self.source = source
+        self.graph = graph
+        if sinks is None:
+            sinks = [s for s in getattr(graph, 'sinks', []) if isinstance(s, AsyncSink)]
+        self.sinks = sinks
+        self.executor = executor
+
+    async def run(self):
+        """
+        Process the stream until its end, and close the sinks.
+
+        Run it as a task (asyncio.ensure_future()) to process several streams concurrently; cancel the task to stop early.
+        """
+        loop = asyncio.get_running_loop()
+        self.source.start()
+        try:
+            while True:
+                x = await self.source.read()
+                if x is None:
+                    break
+                await loop.run_in_executor(self.executor, self.graph.put, x)
+                for sink in self.sinks:
+                    for batch in sink.take():
+                        await sink.deliver(batch)
+        finally:
+            self.source.stop()
+        for sink in self.sinks:
+            await sink.close()
@@ -0,0 +1,166 @@
+"""
+Pipeline-parallel execution of FilterBlock chains.
+
+connect() wires blocks into a synchronous push chain, where every batch runs through all blocks on the caller's thread.
+A Pipeline runs each stage (a block, or a group of blocks) in its own worker thread instead, connected by bounded queues:
+successive batches overlap in different stages, and the numpy/FFT work and the native PLL loop (which release the GIL)
+spread over several cores. A full queue blocks the producer (backpressure), so memory use stays bounded.
+
+Usage:
+    alivecor = AlivecorFilter(48000, ecg_fps=300)
+    pipeline = Pipeline(alivecor.stages)  # rewires the stages: one worker per stage
+    connect(mic, pipeline, sink)
+    ...
+    pipeline.stop()  # flush all stages
+"""
+
+import threading
+import traceback
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import numpy as np
+
+from .filter import FilterBlock, connect
+
+
+class PipelineError(RuntimeError):
+    """A block failed in a pipeline worker thread."""
+    pass
+
+
+_STOP = object()  # queue sentinel
+
+
+class ThreadedStage(FilterBlock):
+    """
+    Runs a chain of FilterBlock objects in a worker thread, fed by a bounded queue.
+
+    Batches are copied when queued, since producers may reuse their output buffers (see the reuse_output option of PLL).
+    The output of the last block is put to the consumer from the worker thread.
+    """
+    def __init__(self, blocks, queue_size=4):
+        """
+        :param blocks:     list of blocks, connected in a chain and run in one thread
+        :param queue_size: max. number of batches waiting for this stage
+        """
+        super(ThreadedStage, self).__init__()
+        self.blocks = list(blocks)
+        self.name = 'ThreadedStage({})'.format(', '.join(type(b).__name__ for b in self.blocks))
+        connect(*self.blocks)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._error = None
+
+    def connect(self, consumer):
+        self._consumer = consumer
+        self.blocks[-1].connect(consumer)
+
+    def start(self):
+        """start the worker thread (also done by the first put())"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def put(self, x):
+        """queue a batch, blocking while the queue is full"""
+        self._check_error()
+        self.start()
+        self._queue.put(np.array(x))
+
+    def stop(self):
+        """process all queued batches and stop the worker thread, raising (and clearing) any failure"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        try:
+            self._check_error()
+        finally:
+            self._error = None  # the stage can be started again
+
+    def _run(self):
+        while True:
+            x = self._queue.get()
+            if x is _STOP:
+                break
+            if self._error is not None:
+                continue  # keep draining, so the producer never blocks on a failed stage
+            try:
+                self.blocks[0].put(x)
+            except Exception:
+                self._error = traceback.format_exc()
+
+    def _check_error(self):
+        if self._error is not None:
+            raise PipelineError('{} failed:\n{}'.format(self.name, self._error))
+
+    def get_state(self):
+        # only consistent while stopped, i.e. with an empty queue
+        return {'blocks': [block.get_state() for block in self.blocks]}
+
+    def set_state(self, state):
+        for block, block_state in zip(self.blocks, state['blocks']):
+            block.set_state(block_state)
+
+
+class Pipeline(FilterBlock):
+    """
+    Chain of ThreadedStage workers connected by bounded queues, usable like a single FilterBlock.
+
+    The blocks are rewired: they must not be connected elsewhere anymore.
+    The consumer of the pipeline is called from the last worker thread. Call stop() to flush all stages.
+    """
+    def __init__(self, stages, queue_size=4):
+        """
+        :param stages:     list of blocks, or of lists of blocks (groups of blocks run in one worker thread)
+        :param queue_size: max. number of batches waiting per stage
+        """
+        super(Pipeline, self).__init__()
+        self.stages = [ThreadedStage(s if isinstance(s, (list, tuple)) else [s], queue_size) for s in stages]
+        connect(*self.stages)
+
+    def connect(self, consumer):
+        self.stages[-1].connect(consumer)
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def put(self, x):
+        self.stages[0].put(x)
+
+    def stop(self):
+        """
+        process all queued batches and stop the worker threads (in order, so every stage gets the whole stream)
+
+        All stages are stopped, even if some failed; the first failure is raised afterwards.
+        """
+        error = None
+        for stage in self.stages:
+            try:
+                stage.stop()
+            except PipelineError as e:
+                error = error or e
+        if error is not None:
+            raise error
+
+    def get_state(self):
+        # only consistent while stopped, i.e. with all queues empty
+        return {'stages': [[block.get_state() for block in stage.blocks] for stage in self.stages]}
+
+    def set_state(self, state):
+        for stage, stage_state in zip(self.stages, state['stages']):
+            for block, block_state in zip(stage.blocks, stage_state):
+                block.set_state(block_state)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
@@ -0,0 +1,186 @@
+"""
+Per-block profiling of FilterBlock graphs: call counts, samples in/out, batch latencies and realtime factors.
+
+A Profiler wraps the batch() method of each block (per instance, only while enabled), so it costs nothing
+when disabled, and measures blocks however they are run: through a connect()ed chain, a Flowgraph, a Pipeline,
+or inside composite blocks. Blocks with stages (e.g. AlivecorFilter, MultistageDecimator, Pipeline) or blocks
+(Flowgraph, ThreadedStage) are profiled together with their parts. A composite's time includes its parts,
+but only counts the calls of its own batch() (e.g. from a Flowgraph, not when its stages are pushed via put()).
+
+Usage:
+    alivecor = AlivecorFilter(48000, ecg_fps=300)
+    profiler = Profiler(alivecor)
+    with profiler:
+        ...  # push data through alivecor
+    print(profiler.report())  # which stage is the bottleneck?
+    profiler.chrome_trace('trace.json')  # timeline, open in chrome://tracing or ui.perfetto.dev
+"""
+
+from __future__ import division
+
+import json
+from collections import OrderedDict
+from timeit import default_timer
+
+import numpy as np
+
+from .filter import SinkBlock
+
+try:
+    from threading import get_ident
+except ImportError:
+    from thread import get_ident
+
+
+class BlockProfile(object):
+    """Batch timings of one block: (start time, duration, samples in, samples out, thread id) per batch() call."""
+    def __init__(self, name, block):
+        self.name = name
+        self.block = block
+        self.events = []
+        self._saved_batch = None  # (had an instance attribute, its value) while installed
+
+    def stats(self):
+        """:returns dict of call count, sample counts, time (seconds) and batch latency percentiles"""
+        events = np.array([e[:4] for e in self.events], dtype=np.float64).reshape(-1, 4)
+        durations = events[:, 1]
+        total = float(np.sum(durations))
+        stats = OrderedDict([
+            ('calls', len(events)),
+            ('samples_in', int(np.sum(events[:, 2]))),
+            ('samples_out', int(np.sum(events[:, 3]))),
+            ('time', total),
+        ])
+        for key, q in [('latency_p50', 50), ('latency_p90', 90), ('latency_p99', 99), ('latency_max', 100)]:
+            stats[key] = float(np.percentile(durations, q)) if len(durations) else 0.0
+        stats['latency_mean'] = total / len(events) if len(events) else 0.0
+        # seconds of input signal processed per second of processing time
+        sampling_rate = getattr(self.block, 'sampling_rate', None)
+        stats['realtime_factor'] = stats['samples_in'] / sampling_rate / total if sampling_rate and total > 0 else None
+        return stats
+
+
+def _parts(block):
+    """:returns the blocks a composite block consists of (without plain sinks, which have no batch())"""
+    parts = getattr(block, 'stages', None) or getattr(block, 'blocks', None) or []
+    return [p for p in parts if not isinstance(p, SinkBlock) or _parts(p)]
+
+
+class Profiler(object):
+    """
+    Collects per-block batch() timings of a set of blocks and their parts.
+
+    Switch on and off with enable() and disable() (or as a context manager), while the blocks are running.
+    Timings are collected from any thread: each block must only run in one thread at a time (as usual).
+    """
+    def __init__(self, *blocks):
+        self.profiles = OrderedDict()  # name -> BlockProfile
+        self.enabled = False
+        self._t0 = default_timer()
+        for block in blocks:
+            self.add(block)
+
+    def add(self, block, name=None):
+        """
+        Profile a block and its parts.
+
+        :param name: name in the results, defaults to the class name (numbered if not unique).
+                     Parts are named '<name>/<part name>'.
+        """
+        if any(p.block is block for p in self.profiles.values()):
+            return
+        if name is None:
+            name = type(block).__name__
+        base, i = name, 1
+        while name in self.profiles:
+            i += 1
+            name = '{}#{}'.format(base, i)
+        self.profiles[name] = BlockProfile(name, block)
+        if self.enabled:
+            self._install(self.profiles[name])
+        for part in _parts(block):
+            self.add(part, '{}/{}'.format(name, type(part).__name__))
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            for profile in self.profiles.values():
+                self._install(profile)
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            for profile in self.profiles.values():
+                self._uninstall(profile)
+
+    def reset(self):
+        """discard the timings collected so far"""
+        for profile in self.profiles.values():
+            profile.events = []
+        self._t0 = default_timer()
+
+    def _install(self, profile):
+        # remember an instance attribute batch (e.g. another Profiler's wrapper), to restore exactly that
+        block_dict = profile.block.__dict__
+        profile._saved_batch = ('batch' in block_dict, block_dict.get('batch'))
+        batch = profile.block.batch
+
+        def timed_batch(x):
+            start = default_timer()
+            y = batch(x)
+            profile.events.append((start, default_timer() - start, len(x), len(y), get_ident()))
+            return y
+        # instance attribute, shadowing the class method until disable()
+        profile.block.batch = timed_batch
+
+    def _uninstall(self, profile):
+        had_batch, batch = profile._saved_batch
+        if had_batch:
+            profile.block.batch = batch
+        else:
+            profile.block.__dict__.pop('batch', None)
+        profile._saved_batch = None
+
+    def stats(self):
+        """:returns OrderedDict of block name -> BlockProfile.stats()"""
+        return OrderedDict((name, profile.stats()) for name, profile in self.profiles.items())
+
+    def report(self):
+        """:returns table of the stats() of the blocks whose batch() was called, as a string"""
+        stats = [(name, s) for name, s in self.stats().items() if s['calls'] > 0]
+        width = max([len('block')] + [len(name) for name, _ in stats])
+        lines = ['{:{w}s} {:>7s} {:>11s} {:>11s} {:>9s} {:>9s} {:>9s} {:>9s}'.format(
+            'block', 'calls', 'samples in', 'samples out', 'time (s)', 'p50 (ms)', 'p99 (ms)', 'realtime', w=width)]
+        for name, s in stats:
+            realtime = '{:8.1f}x'.format(s['realtime_factor']) if s['realtime_factor'] is not None else ''
+            lines.append('{:{w}s} {:7d} {:11d} {:11d} {:9.3f} {:9.3f} {:9.3f} {:>9s}'.format(
+                name, s['calls'], s['samples_in'], s['samples_out'], s['time'],
+                1e3 * s['latency_p50'], 1e3 * s['latency_p99'], realtime, w=width))
+        return '\n'.join(lines)
+
+    def chrome_trace(self, file_name=None):
+        """
+        Timeline of all batch() calls in the Chrome trace event format (complete events, one track per thread).
+
+        :param file_name: if given, write the trace as JSON to this file
+        :returns trace dict
+        """
+        events = []
+        for name, profile in self.profiles.items():
+            for start, duration, n_in, n_out, tid in profile.events:
+                events.append({'name': name, 'cat': 'batch', 'ph': 'X', 'pid': 0, 'tid': tid,
+                               'ts': 1e6 * (start - self._t0), 'dur': 1e6 * duration,
+                               'args': {'samples_in': n_in, 'samples_out': n_out}})
+        events.sort(key=lambda e: e['ts'])
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if file_name is not None:
+            with open(file_name, 'w') as f:
+                json.dump(trace, f)
+        return trace
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.disable()
@@ -1,6 +1,11 @@
 from __future__ import division
 
+import hashlib
+import time
+from collections import OrderedDict
+
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from scipy import interpolate
 from scipy import signal
 from scipy.interpolate import interp1d
@@ -35,34 +40,171 @@ def nextpow2(n):
     return int(2**int(m_i))
 
 
-def filter_fft_ff(sig, taps):
+_SPECTRUM_CACHE_SIZE = 32  # max. number of filter spectra kept by taps_spectrum()
+FFT_BATCH_MAX_BYTES = 32 * 2**20  # memory cap for the spectra of blocks transformed in one batch by _overlap_save()
+FFT_AUTOTUNE = False  # let fft_block_size() measure the best candidates once per (ntaps, signal length)
+_FFT_BLOCK_COST = 256.0  # per-block overhead, in units of overlap_save_cost()
+_FFT_CALL_COST = 30000.0  # fixed overhead of an overlap-save call, in units of overlap_save_cost()
+_DIRECT_MAC_COST = 0.15  # one multiply-accumulate of np.convolve(), in units of overlap_save_cost()
+_spectrum_cache = OrderedDict()
+_BLOCK_SIZE_CACHE_SIZE = 256
+_block_size_cache = {}  # (ntaps, nsig) -> planned FFT size
+_block_size_tuned = OrderedDict()  # (ntaps, nsig) -> measured best FFT size (autotune), LRU
+
+
+def taps_spectrum(taps, N, real=True):
     """
-    Applies a filter to a signal, implementing the overlap-save method (chunk up the signal)
-    see https://en.wikipedia.org/wiki/Overlap%E2%80%93save_method
+    FFT of the filter impulse response `taps`, zero-padded to length N.
 
-    This is equivalent to:  np.convolve(x, taps, mode='valid')  but more efficient for long signals
+    Spectra are cached (LRU) by taps content and N, so filtering again and again with the same taps
+    (e.g. calling lowpass_fft() on many signals) does not recompute them.
+    The returned array is read-only, since it is shared between callers.
+
+    :param real: if True, returns the one-sided np.fft.rfft() spectrum for real-valued filtering (taps must be real),
+                 otherwise the full complex np.fft.fft() spectrum.
     """
+    taps = np.ascontiguousarray(taps)
+    key = (real, taps.dtype.str, len(taps), N, hashlib.sha1(taps.view(np.uint8)).hexdigest())
+    H = _spectrum_cache.pop(key, None)
+    if H is None:
+        H = np.fft.rfft(taps, N) if real else np.fft.fft(taps, N)
+        H.setflags(write=False)
+        while len(_spectrum_cache) >= _SPECTRUM_CACHE_SIZE:
+            _spectrum_cache.popitem(last=False)
+    _spectrum_cache[key] = H  # (re-)insert as most recently used
+    return H
+
+
+def smooth_numbers(lo, hi):
+    """:returns sorted list of the 5-smooth numbers 2^a * 3^b * 5^c in [lo, hi] (fast FFT sizes)"""
+    nums = []
+    p5 = 1
+    while p5 <= hi:
+        p35 = p5
+        while p35 <= hi:
+            n = p35
+            while n <= hi:
+                if n >= lo:
+                    nums.append(n)
+                n *= 2
+            p35 *= 3
+        p5 *= 5
+    return sorted(nums)
+
+
+def overlap_save_cost(ntaps, nsig, N):
+    """Cost model: number of overlap-save blocks times an FFT + spectrum multiply + iFFT of size N."""
+    step_size = N - (ntaps - 1)
+    num_blocks = -(-(nsig - ntaps + 1) // step_size)  # ceil
+    return num_blocks * (N * (2.0 * np.log2(N) + 1.0) + _FFT_BLOCK_COST)
+
+
+def fft_block_size(ntaps, nsig, autotune=None):
+    """
+    Plan the FFT block size N for overlap-save filtering of `nsig` samples with `ntaps` taps.
+
+    Picks the fast FFT size (5-smooth number) that minimizes overlap_save_cost(). Small N waste
+    most of each block on the overlap, large N waste FFT work on the end padding of short signals.
 
+    :param autotune: if True, measure the best few candidates of the cost model once, and remember
+                     the fastest one for this (ntaps, nsig). Defaults to FFT_AUTOTUNE.
+    """
+    key = (ntaps, nsig)
+    if autotune is None:
+        autotune = FFT_AUTOTUNE
+    if autotune and key in _block_size_tuned:
+        N = _block_size_tuned.pop(key)
+        _block_size_tuned[key] = N  # re-insert as most recently used, measurements are expensive
+        return N
+    if not autotune and key in _block_size_cache:
+        return _block_size_cache[key]
+
+    hi = smooth_numbers(nsig, 2 * nsig)[0]  # one block covering the whole signal
+    candidates = smooth_numbers(ntaps, hi)
+    candidates.sort(key=lambda N: overlap_save_cost(ntaps, nsig, N))
+
+    if autotune:
+        N = _autotune_block_size(ntaps, nsig, candidates[:5])
+        while len(_block_size_tuned) >= _BLOCK_SIZE_CACHE_SIZE:
+            _block_size_tuned.popitem(last=False)
+        _block_size_tuned[key] = N
+    else:
+        N = candidates[0]
+        if len(_block_size_cache) >= _BLOCK_SIZE_CACHE_SIZE:
+            _block_size_cache.clear()
+        _block_size_cache[key] = N
+    return N
+
+
+def _autotune_block_size(ntaps, nsig, candidates, repeat=3):
+    """:returns the fastest of the FFT block size `candidates`, measured on a random signal"""
+    sig, taps = np.random.randn(nsig), np.random.randn(ntaps)
+    timings = []
+    for N in candidates:
+        spectra = {}
+        _overlap_save(sig, taps, spectra, real=True, N=N)  # warm up, computing the spectrum
+        best = np.inf
+        for _ in range(repeat):
+            before = time.time()
+            _overlap_save(sig, taps, spectra, real=True, N=N)
+            best = min(best, time.time() - before)
+        timings.append(best)
+    return candidates[int(np.argmin(timings))]
+
+
+def _overlap_save(sig, taps, spectra, real, batched=True, N=None):
+    """
+    Overlap-save convolution engine behind filter_fft_ff() and filter_fft_cc().
+
+    :param real:    use the real-valued rfft/irfft transforms (half the work of the complex FFT)
+    :param batched: transform all overlapping blocks at once, as rows of a 2-D strided view of the signal
+                    (in chunks of blocks limited to FFT_BATCH_MAX_BYTES), instead of looping over blocks in Python
+    :param N:       FFT block size, planned by fft_block_size() if not given
+
+    The output keeps the precision of sig and taps (e.g. float32 / complex64), although numpy computes the FFTs in double.
+    """
+    sig = np.asarray(sig)
     assert(len(sig) > len(taps))  # expect a long signal
     # ^ we could try reversing sig and taps in this case,
     # but the caller would be surprised to get a longer return value than expected
 
-    h = taps
     M = len(taps)
     overlap = M - 1
-    N = nextpow2(4*overlap)
+    if N is None:
+        N = fft_block_size(M, len(sig))
     step_size = N - overlap
-    # TODO: keep filter's FFT around (cache it) instead of recomputing it every time. e.g. currently 15 ms (out of 50 ms) just for Bandreject's H
-    H = np.fft.fft(h, N)
-    x = np.concatenate([sig, np.zeros(N)])  # end padding, so the last step_size batch will surely cover the end
-    y = np.zeros(len(x))
-    for pos in range(0, len(x)+1 - N, step_size):
-        #print(pos)
-        yt = np.fft.ifft(np.fft.fft(x[pos:pos+N], N) * H, N)
-        y[pos:pos+step_size] = yt[M-1:N].real
+    H = spectra.get((N, real)) if spectra is not None else None
+    if H is None:
+        H = taps_spectrum(taps, N, real=real)
+        if spectra is not None:
+            # keep only the spectrum of the current block size, so varying batch lengths do not pile up spectra
+            # (the bounded taps_spectrum() cache still has the others)
+            spectra.clear()
+            spectra[(N, real)] = H
+    fft, ifft = (np.fft.rfft, np.fft.irfft) if real else (np.fft.fft, np.fft.ifft)
+    num_blocks = -(-(len(sig) - overlap) // step_size)  # ceil
+    num_full = max(0, min(num_blocks, (len(sig) - N) // step_size + 1))  # blocks lying entirely within sig
+    # only the blocks reaching past the end of sig are read from a zero-padded copy of the tail
+    tail = sig[num_full * step_size:]
+    tail = np.concatenate([tail, np.zeros((num_blocks - num_full - 1) * step_size + N - len(tail), dtype=sig.dtype)])
+    dtype = np.result_type(sig, taps, np.float32 if real else np.complex64)
+    y = np.zeros((num_blocks, step_size), dtype=dtype)
+    for x, first, num in [(sig, 0, num_full), (tail, num_full, num_blocks - num_full)]:
+        if batched:
+            # row i is the block x[i*step_size:i*step_size+N] (no copy)
+            blocks = as_strided(x, shape=(num, N), strides=(step_size * x.strides[0], x.strides[0]))
+            chunk = max(1, FFT_BATCH_MAX_BYTES // (N * 16))  # complex128 per block: N/2+1 bins (rfft), N bins (fft)
+            for i in range(0, num, chunk):
+                yt = ifft(fft(blocks[i:i+chunk], N, axis=1) * H, N, axis=1)
+                y[first+i:first+min(i+chunk, num)] = yt[:, M-1:N]
+        else:
+            for i in range(num):
+                pos = i * step_size
+                yt = ifft(fft(x[pos:pos+N], N) * H, N)
+                y[first+i] = yt[M-1:N]
     # cut back the end padding, and the overlap region where taps hang out of the signal
     #y = y[:-N-M//2]  # what is wrong with this line??
-    y = y[0:len(sig)-len(taps)+1]
+    y = y.reshape(-1)[0:len(sig)-len(taps)+1]
 
     # if latency is an issue, see "block convolver" (Bill Gardner)
     # here: http://dsp.stackexchange.com/questions/2537/do-fft-based-filtering-methods-add-intrinsic-latency-to-a-real-time-algorithm
@@ -70,6 +212,56 @@ def filter_fft_ff(sig, taps):
     return y
 
 
+def filter_fft_ff(sig, taps, spectra=None, batched=True):
+    """
+    Applies a filter to a signal, implementing the overlap-save method (chunk up the signal)
+    see https://en.wikipedia.org/wiki/Overlap%E2%80%93save_method
+
+    This is equivalent to:  np.convolve(x, taps, mode='valid')  but more efficient for long signals
+
+    Real-valued signal and taps are filtered with rfft/irfft. Complex input falls back to filter_fft_cc(),
+    of which only the real part is returned.
+
+    :param spectra: optional dict, where the caller keeps the filter's spectrum for the last FFT block size around
+                    across calls (see FIRFilter). Other block sizes come from the shared taps_spectrum() cache.
+    :param batched: transform all blocks in one batched FFT call (default) instead of one call per block
+    """
+    if np.iscomplexobj(sig) or np.iscomplexobj(taps):
+        return filter_fft_cc(sig, taps, spectra, batched).real
+    return _overlap_save(sig, taps, spectra, real=True, batched=batched)
+
+
+def filter_fft_cc(sig, taps, spectra=None, batched=True):
+    """Complex variant of filter_fft_ff(): equivalent to  np.convolve(x, taps, mode='valid')  for complex signals or taps."""
+    return _overlap_save(sig, taps, spectra, real=False, batched=batched)
+
+
+def convolve_valid(sig, taps, spectra=None):
+    """
+    Equivalent to:  np.convolve(sig, taps, mode='valid')
+
+    Dispatches to the direct method or to FFT overlap-save (filter_fft_ff() / filter_fft_cc()),
+    whichever is estimated to be cheaper for the tap count and signal length:
+    short taps or short signals are convolved directly, long taps on long signals via FFT.
+
+    A signal shorter than the taps has no valid output samples: returns an empty array
+    (np.convolve() would swap the operands instead).
+
+    :param spectra: optional dict, where the caller keeps the filter's spectra around (see filter_fft_ff())
+    """
+    M, L = len(taps), len(sig)
+    if L < M:
+        return np.zeros(0, dtype=np.result_type(sig, taps))
+    if L > M:
+        direct_cost = _DIRECT_MAC_COST * (L - M + 1) * M
+        fft_cost = _FFT_CALL_COST + overlap_save_cost(M, L, fft_block_size(M, L))
+        if fft_cost < direct_cost:
+            if np.iscomplexobj(sig) or np.iscomplexobj(taps):
+                return filter_fft_cc(sig, taps, spectra)
+            return filter_fft_ff(sig, taps, spectra)
+    return np.convolve(sig, taps, mode='valid')
+
+
 # copied heartbeat_localmax() from heartshield-kivy-app/utils.py, added some more docstring
 def localmax(d):
     """
@@ -151,20 +343,20 @@ def grid_resample(times, series, target_fps=30.0):
 
 
 def highpass(signal, fps, cf=0.5, tw=0.4):
-    from gr_firdes import firdes
+    from gr_firdes import cache as firdes
     cutoff_freq = cf
     transition_width = tw
     taps = firdes.high_pass_2(1.0, fps, cutoff_freq, transition_width, 60.0)
     if len(signal) == 0: return np.array([])  # workaround failing np.pad([])
-    return np.convolve(np.pad(signal, (len(taps)//2,len(taps)//2), 'edge'), taps, mode='valid')
+    return convolve_valid(np.pad(signal, (len(taps)//2,len(taps)//2), 'edge'), taps)
 
 def lowpass(signal, fps, cf=3.0, tw=0.4):
-    from gr_firdes import firdes
+    from gr_firdes import cache as firdes
     cutoff_freq = cf
     transition_width = tw
     taps = firdes.low_pass_2(1.0, fps, cutoff_freq, transition_width, 60.0)
     if len(signal) == 0: return np.array([])  # workaround failing np.pad([])
-    return np.convolve(np.pad(signal, (len(taps)//2,len(taps)//2), 'edge'), taps, mode='valid')
+    return convolve_valid(np.pad(signal, (len(taps)//2,len(taps)//2), 'edge'), taps)
 
 def highpass_fft(signal, fps, cf=0.5, tw=0.4):
     from filter import Highpass, apply_filter
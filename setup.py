@@ -1,4 +1,7 @@
+import sys
+
 from distutils.core import setup
+from distutils.command.build_py import build_py
 from distutils.extension import Extension
 
 try:
@@ -40,11 +43,25 @@ extensions = [
 if USE_CYTHON:
     extensions = cythonize(extensions)
 
+# The package targets Python 2.7. Only hsh_signal.live (asyncio live capture) requires Python 3,
+# and Python 2 cannot byte-compile it, so Python 2 builds leave it out.
+PY3_ONLY_MODULES = [('hsh_signal', 'live')]
+
+
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info[0] < 3:
+            modules = [m for m in modules if (m[0], m[1]) not in PY3_ONLY_MODULES]
+        return modules
+
+
 setup(
     name='hsh-signal',
     version='0.1.5',
     packages=['hsh_signal', 'gr_pll', 'gr_firdes'],
-    ext_modules=extensions
+    ext_modules=extensions,
+    cmdclass={'build_py': BuildPy}
 )
 
 # run as:
@@ -0,0 +1,202 @@
+import pickle
+import threading
+
+import numpy as np
+
+from hsh_signal.filter import BatchSink, DataSink, ChunkDataSource, connect, snapshot, restore
+from hsh_signal.flowgraph import Flowgraph
+from hsh_signal.alivecor import decode_alivecor, decode_alivecor_stream, decode_alivecor_parallel, AlivecorFilter
+
+
+def fm_test_signal(fps=48000, f_center=18.8e3, f_shift=100):
+    """synthetic FM signal as in decode_alivecor.py: carrier with frequency shifts and two chirps"""
+    stretches = [(1.5, 0), (0.1, 1), (0.2, -1), (0.3, 1), (0.4, -1), (1.0, 0)]
+    sig = []
+    for dur_sec, f_shift_sign in stretches:
+        t = np.arange(int(fps*dur_sec)) / float(fps)
+        sig.append(np.cos(2*np.pi*(f_center+f_shift_sign*f_shift)*t))
+    sig = np.concatenate(sig)
+
+    T = int(0.5*fps)
+    t = np.arange(T) / float(fps)
+    chrp = np.cos(2*np.pi*(100 + (t / t[-1]) * (8000 - 100))*t)
+    sig[T:2*T] = chrp
+    sig[2*T:3*T] = chrp
+    return sig * 1e-3
+
+
+def test_decode_alivecor_multirate():
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    ecg = decode_alivecor(sig, fps=fps)[::fps//ecg_fps]
+    ecg_mr = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps)
+    assert len(ecg_mr) == len(ecg)
+    # skip the PLL lock-in and the zero-padded end
+    ecg, ecg_mr = ecg[100:-100], ecg_mr[100:-100]
+    assert np.max(np.abs(ecg_mr - ecg)) < 0.01 * np.ptp(ecg)
+    assert np.corrcoef(ecg, ecg_mr)[0, 1] > 0.9999
+
+
+def test_decode_alivecor_xlating():
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps)
+    ecg_xl = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=AlivecorFilter.FRONTEND_XLATING)
+    assert len(ecg_xl) == len(ecg)
+    # compare the FM part after the chirps, where the PLLs are locked
+    ecg, ecg_xl = ecg[520:1000], ecg_xl[520:1000]
+    assert np.max(np.abs(ecg_xl - ecg)) < 0.1 * np.ptp(ecg)
+    assert np.corrcoef(ecg, ecg_xl)[0, 1] > 0.999
+    for fps, ecg_fps, message in [(4000, 250, 'fps 4000'), (48000, 700, 'ecg_fps 700')]:
+        try:
+            AlivecorFilter(fps, ecg_fps, frontend=AlivecorFilter.FRONTEND_XLATING)
+            assert False, 'expected ValueError'
+        except ValueError as e:
+            assert message in str(e)
+
+
+def test_decode_alivecor_quadrature():
+    """accuracy of the quadrature discriminator, compared to the PLL and to the known carrier frequency"""
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    hz = fps / (2*np.pi)  # radians per sample -> Hz
+    for frontend, max_err_hz in [(AlivecorFilter.FRONTEND_BANDPASS, 10.0), (AlivecorFilter.FRONTEND_XLATING, 2.0)]:
+        ecg_pll = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend) * hz
+        ecg_qd = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend, demod=AlivecorFilter.DEMOD_QUADRATURE) * hz
+        assert len(ecg_qd) == len(ecg_pll)
+        # the FM part after the chirps
+        assert np.corrcoef(ecg_pll[520:1000], ecg_qd[520:1000])[0, 1] > 0.998
+        # steady state of the last stretch (unmodulated 18.8 kHz carrier)
+        assert np.max(np.abs(ecg_qd[850:950] - 18.8e3)) < max_err_hz
+
+
+def test_decode_alivecor_float32():
+    """float32 processing must stay close to the float64 result"""
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    for frontend in [AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.FRONTEND_XLATING]:
+        ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend)
+        ecg_32 = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend, dtype=np.float32)
+        assert ecg_32.dtype == np.float32 and len(ecg_32) == len(ecg)
+        # the FM part after the chirps, before the filters reach into the zero padding (no carrier to lock on)
+        ecg, ecg_32 = ecg[520:900], ecg_32[520:900]
+        assert np.max(np.abs(ecg_32 - ecg)) < 1e-3 * np.ptp(ecg)
+
+
+def test_decode_alivecor_stream():
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)[:-77]
+    ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps)
+    ratio = fps // ecg_fps
+    # chunks below, at and around the decimation ratio make the decimators emit empty and uneven batches
+    for batch_size in [50, 128, ratio - 1, ratio, ratio + 1, 1000, 48000, len(sig)]:
+        chunks = (sig[i:i+batch_size] for i in range(0, len(sig), batch_size))
+        blocks = list(decode_alivecor_stream(chunks, fps=fps, ecg_fps=ecg_fps))
+        assert len(blocks) > 1 or batch_size == len(sig)
+        ecg_stream = np.concatenate(blocks)
+        assert len(ecg_stream) == len(ecg)
+        # towards the end, the filters reach into the zero padding, where the unlocked PLL amplifies rounding differences
+        assert np.allclose(ecg_stream[:800], ecg[:800])
+    # the other frontend and demodulator, with chunks below the ratio
+    for frontend, demod in [(AlivecorFilter.FRONTEND_XLATING, AlivecorFilter.DEMOD_PLL),
+                            (AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.DEMOD_QUADRATURE)]:
+        ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend, demod=demod)
+        chunks = (sig[i:i+50] for i in range(0, len(sig), 50))
+        ecg_stream = np.concatenate(list(decode_alivecor_stream(chunks, fps=fps, ecg_fps=ecg_fps, frontend=frontend, demod=demod)))
+        assert len(ecg_stream) == len(ecg)
+        assert np.allclose(ecg_stream[:800], ecg[:800])
+
+
+def test_decode_alivecor_parallel():
+    fps, ecg_fps = 48000, 300
+    # carrier with a slow sinusoidal frequency modulation
+    t = np.arange(6 * fps) / float(fps)
+    sig = 1e-3 * np.cos(2*np.pi*18.8e3*t + 100 * np.sin(2*np.pi*1.0*t))
+    ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps)
+    ecg_par = decode_alivecor_parallel(sig, fps=fps, ecg_fps=ecg_fps, segment_duration=1.3, lockin_duration=0.2, processes=2)
+    assert len(ecg_par) == len(ecg)
+    # skip the end, where the filters reach into the zero padding (no carrier to lock on)
+    assert np.max(np.abs(ecg_par[:-150] - ecg[:-150])) < 1e-4 * np.ptp(ecg[:-150])
+    for kwargs in [dict(out_file='ecg.npy'), dict(pipelined=True), dict(debug=True)]:
+        try:
+            decode_alivecor_parallel(sig, fps=fps, ecg_fps=ecg_fps, **kwargs)
+            assert False, 'expected ValueError for {}'.format(kwargs)
+        except ValueError as e:
+            assert list(kwargs)[0] in str(e)
+
+
+def test_alivecor_snapshot():
+    """a stream resumed from a snapshot continues exactly like the uninterrupted stream"""
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    head, tail = sig[:100000], sig[100000:]
+    for frontend, demod in [(AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.DEMOD_PLL),
+                            (AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.DEMOD_QUADRATURE),
+                            (AlivecorFilter.FRONTEND_XLATING, AlivecorFilter.DEMOD_PLL),
+                            (AlivecorFilter.FRONTEND_XLATING, AlivecorFilter.DEMOD_QUADRATURE)]:
+        outputs = []
+        for resume in [False, True]:
+            alivecor, sink = AlivecorFilter(fps, ecg_fps, frontend, demod), BatchSink()
+            connect(alivecor, sink)
+            alivecor.put(head)
+            if resume:
+                snap = pickle.loads(pickle.dumps(snapshot(alivecor), protocol=2))
+                alivecor, sink = AlivecorFilter(fps, ecg_fps, frontend, demod), BatchSink()
+                connect(alivecor, sink)
+                restore(snap, alivecor)
+            sink.take()
+            alivecor.put(tail)
+            outputs.append(np.concatenate(sink.take()))
+        assert np.allclose(outputs[0], outputs[1])
+
+
+def test_decode_alivecor_pipelined():
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    for frontend in [AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.FRONTEND_XLATING]:
+        ecg = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend)
+        ecg_pipelined = decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend, pipelined=True)
+        assert np.array_equal(ecg_pipelined, ecg)
+
+    # a failure while feeding the pipeline stops it, without leaving worker threads behind
+    poll, polls = ChunkDataSource.poll, []
+    def failing_poll(self):
+        polls.append(None)
+        if len(polls) > 1:
+            raise IOError('audio source failed')
+        poll(self)
+    num_threads = threading.active_count()
+    ChunkDataSource.poll = failing_poll
+    try:
+        decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, pipelined=True)
+        assert False, 'expected IOError'
+    except IOError:
+        pass
+    finally:
+        ChunkDataSource.poll = poll
+    assert threading.active_count() == num_threads
+
+
+def test_alivecor_flowgraph():
+    """the flowgraph compensates the multi-rate latency exactly as decode_alivecor()"""
+    fps, ecg_fps = 48000, 300
+    sig = fm_test_signal(fps)
+    for frontend in [AlivecorFilter.FRONTEND_BANDPASS, AlivecorFilter.FRONTEND_XLATING]:
+        alivecor, sink = AlivecorFilter(fps, ecg_fps, frontend), DataSink()
+        graph = Flowgraph()
+        graph.connect(alivecor, sink)
+        assert graph.latency() == alivecor.delay
+        graph.run(sig)
+        assert np.allclose(sink.data, decode_alivecor(sig, fps=fps, ecg_fps=ecg_fps, frontend=frontend))
+
+
+if __name__ == '__main__':
+    test_decode_alivecor_multirate()
+    test_decode_alivecor_xlating()
+    test_decode_alivecor_quadrature()
+    test_decode_alivecor_float32()
+    test_decode_alivecor_stream()
+    test_decode_alivecor_parallel()
+    test_alivecor_snapshot()
+    test_decode_alivecor_pipelined()
+    test_alivecor_flowgraph()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import struct
+import tempfile
+import wave
+
+import numpy as np
+
+from hsh_signal.audio import WavFile, WAVE_FORMAT_EXTENSIBLE, KSDATAFORMAT_SUBTYPE_PCM
+from hsh_signal.alivecor import load_raw_audio
+
+
+def write_wav(file_name, frames, fps):
+    wf = wave.open(file_name, 'wb')
+    wf.setnchannels(frames.shape[1])
+    wf.setsampwidth(2)
+    wf.setframerate(fps)
+    wf.writeframes(frames.astype('<i2').tobytes())
+    wf.close()
+
+
+def test_wav_file():
+    fps = 8000
+    frames = np.random.randint(-2**15, 2**15, size=(3*fps, 2))
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_name = os.path.join(tmp_dir, 'stereo.wav')
+        write_wav(file_name, frames, fps)
+        wav = WavFile(file_name)
+        assert (wav.sampling_rate, wav.num_channels, wav.num_frames) == (fps, 2, 3*fps)
+        assert np.array_equal(wav.channel(1), frames[:, 1])
+        # time window
+        assert np.array_equal(wav.channel(0, offset=1.0, duration=0.5), frames[fps:fps+fps//2, 0])
+        x, fps_loaded = load_raw_audio(file_name, dtype=np.float32, offset=2.5)
+        assert fps_loaded == fps and x.dtype == np.float32
+        assert np.array_equal(x, frames[5*fps//2:, 0] / 2.0**15)
+        # lazy conversion
+        lazy = wav.lazy_samples(0)
+        assert len(lazy) == 3*fps
+        assert np.array_equal(lazy[10:20], frames[10:20, 0] / 2.0**15)
+
+        # interrupted recording: data chunk size larger than the file
+        with open(file_name, 'r+b') as f:
+            f.truncate(os.path.getsize(file_name) - 5)
+        assert WavFile(file_name).num_frames == 3*fps - 2
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def write_wav_extensible(file_name, frames, fps, bits=16, valid_bits=16, sub_format=KSDATAFORMAT_SUBTYPE_PCM, cb_size=22):
+    """write a WAVE_FORMAT_EXTENSIBLE file with the given fmt extension (16-bit data)"""
+    channels = frames.shape[1]
+    fmt = struct.pack('<HHIIHH', WAVE_FORMAT_EXTENSIBLE, channels, fps, fps * channels * 2, channels * 2, bits)
+    fmt += struct.pack('<HHI16s', cb_size, valid_bits, 0, sub_format)[:2 + cb_size]
+    data = frames.astype('<i2').tobytes()
+    with open(file_name, 'wb') as f:
+        f.write(b'RIFF' + struct.pack('<I', 4 + 8 + len(fmt) + 8 + len(data)) + b'WAVE')
+        f.write(b'fmt ' + struct.pack('<I', len(fmt)) + fmt)
+        f.write(b'data' + struct.pack('<I', len(data)) + data)
+
+
+def test_wav_extensible():
+    fps = 8000
+    frames = np.random.randint(-2**15, 2**15, size=(fps, 2))
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_name = os.path.join(tmp_dir, 'extensible.wav')
+        write_wav_extensible(file_name, frames, fps)
+        wav = WavFile(file_name)
+        assert (wav.sampling_rate, wav.num_channels, wav.num_frames) == (fps, 2, fps)
+        assert np.array_equal(wav.channel(1), frames[:, 1])
+
+        float_format = b'\x03' + KSDATAFORMAT_SUBTYPE_PCM[1:]  # KSDATAFORMAT_SUBTYPE_IEEE_FLOAT
+        for kwargs in [dict(sub_format=float_format), dict(valid_bits=12), dict(bits=24, valid_bits=24), dict(cb_size=0)]:
+            write_wav_extensible(file_name, frames, fps, **kwargs)
+            try:
+                WavFile(file_name)
+                assert False, 'expected ValueError for {}'.format(kwargs)
+            except ValueError:
+                pass
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    test_wav_file()
+    test_wav_extensible()
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import hsh_signal.batch_decode
+from hsh_signal.batch_decode import main, output_filename
+from hsh_signal.heartseries import Series, HeartSeries
+from hsh_signal.alivecor import decode_alivecor_file
+from test_audio import write_wav
+
+
+def decode_without_beats(file_name):
+    """stands in for beatdet_alivecor_file(): decodes, but skips the beat detection (needs kimqrsdetector)"""
+    ecg = np.concatenate([np.zeros(0)] + list(decode_alivecor_file(file_name, ecg_fps=300)))
+    return HeartSeries(ecg, [], fps=300)
+
+
+def test_batch_decode():
+    fps = 48000
+    t = np.arange(fps // 2) / float(fps)
+    tmp_dir = tempfile.mkdtemp()
+    beatdet = hsh_signal.batch_decode.beatdet_alivecor_file
+    hsh_signal.batch_decode.beatdet_alivecor_file = decode_without_beats
+    try:
+        in_dir, out_dir = os.path.join(tmp_dir, 'in'), os.path.join(tmp_dir, 'out')
+        os.mkdir(in_dir)
+        wav_files = [os.path.join(in_dir, name) for name in ['a.wav', 'b.wav']]
+        for f_carrier, wav_file in zip([18.7e3, 18.9e3], wav_files):
+            frames = 1e4 * np.cos(2*np.pi*f_carrier*t)
+            write_wav(wav_file, frames.reshape(-1, 1), fps)
+        assert main([in_dir, '-o', out_dir, '-j', '1']) == 0
+        out_files = [output_filename(f, out_dir) for f in wav_files]
+        ecgs = [Series.load(f) for f in out_files]
+        assert all(isinstance(ecg, HeartSeries) and ecg.fps == 300 and len(ecg.x) == 150 for ecg in ecgs)
+        assert sorted(os.listdir(out_dir)) == ['a_ecg.b', 'b_ecg.b']
+
+        # existing outputs are skipped, a corrupt input is reported without stopping the others
+        for f in out_files:
+            os.utime(f, (0, 0))
+        with open(os.path.join(in_dir, 'c.wav'), 'wb') as f:
+            f.write(b'RIFF')
+        new_wav = os.path.join(in_dir, 'd.wav')
+        shutil.copy(wav_files[0], new_wav)
+        assert main([in_dir, '-o', out_dir, '-j', '1']) == 1
+        assert [os.path.getmtime(f) for f in out_files] == [0, 0]
+        assert sorted(os.listdir(out_dir)) == ['a_ecg.b', 'b_ecg.b', 'd_ecg.b']
+    finally:
+        hsh_signal.batch_decode.beatdet_alivecor_file = beatdet
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    test_batch_decode()
@@ -0,0 +1,519 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+try:
+    from threading import get_ident
+except ImportError:
+    from thread import get_ident
+
+import hsh_signal.signal
+from hsh_signal.signal import filter_fft_ff, filter_fft_cc, taps_spectrum, fft_block_size, smooth_numbers, convolve_valid
+from hsh_signal.pipeline import Pipeline, PipelineError
+from hsh_signal.flowgraph import Flowgraph, FlowgraphError
+from hsh_signal.profiling import Profiler
+from hsh_signal.am import _AMDemod
+from hsh_signal.filter import FilterBlock, SourceBlock, FIRFilter, Decimator, Downsampler, Delay, DataSink, MemmapSink, Hilbert, PLL, HilbertPLL, \
+    RegroupBatches, Rescale, Splitter, apply_filter, connect, snapshot, restore
+
+
+def test_filter_fft_ff():
+    x = np.random.randn(20000)
+    taps = np.random.randn(301).astype(np.float32)
+    assert np.allclose(filter_fft_ff(x, taps), np.convolve(x, taps, mode='valid'))
+
+
+def test_filter_fft_cc():
+    x = np.random.randn(20000) + 1j * np.random.randn(20000)
+    taps = np.random.randn(301).astype(np.float32)
+    assert np.allclose(filter_fft_cc(x, taps), np.convolve(x, taps, mode='valid'))
+
+
+def test_filter_fft_block_boundaries():
+    """signals ending at, before and after a block boundary (only the last blocks are zero-padded)"""
+    taps = np.random.randn(31)
+    for nsig in [32, 63, 64, 65, 97, 98, 1000]:
+        x = np.random.randn(nsig)
+        for batched in [True, False]:
+            assert np.allclose(hsh_signal.signal._overlap_save(x, taps, None, real=True, batched=batched, N=64),
+                               np.convolve(x, taps, mode='valid'))
+
+
+def test_filter_fft_batched():
+    x = np.random.randn(50000)
+    taps = np.random.randn(301).astype(np.float32)
+    y = filter_fft_ff(x, taps, batched=False)
+    assert np.allclose(filter_fft_ff(x, taps, batched=True), y)
+
+    # memory cap forcing several chunks of blocks
+    max_bytes = hsh_signal.signal.FFT_BATCH_MAX_BYTES
+    try:
+        hsh_signal.signal.FFT_BATCH_MAX_BYTES = 100000
+        assert np.allclose(filter_fft_ff(x, taps, batched=True), y)
+    finally:
+        hsh_signal.signal.FFT_BATCH_MAX_BYTES = max_bytes
+
+
+def test_fft_block_size():
+    for ntaps, nsig in [(65, 100), (301, 20000), (43637, 45236), (43637, 2000000)]:
+        N = fft_block_size(ntaps, nsig)
+        assert N >= ntaps
+        assert smooth_numbers(N, N) == [N]
+
+    # autotune measures once per (ntaps, nsig), and keeps at most _BLOCK_SIZE_CACHE_SIZE results
+    autotune, cache_size = hsh_signal.signal._autotune_block_size, hsh_signal.signal._BLOCK_SIZE_CACHE_SIZE
+    measured = []
+    def counting_autotune(ntaps, nsig, candidates):
+        measured.append((ntaps, nsig))
+        return autotune(ntaps, nsig, candidates)
+    hsh_signal.signal._autotune_block_size = counting_autotune
+    hsh_signal.signal._BLOCK_SIZE_CACHE_SIZE = 2
+    hsh_signal.signal._block_size_tuned.clear()
+    try:
+        N = fft_block_size(301, 20000, autotune=True)
+        assert fft_block_size(301, 20000, autotune=True) == N
+        assert measured == [(301, 20000)]
+        fft_block_size(301, 5000, autotune=True)
+        fft_block_size(301, 20000, autotune=True)  # most recently used, stays cached
+        fft_block_size(65, 5000, autotune=True)
+        assert len(hsh_signal.signal._block_size_tuned) == 2
+        assert fft_block_size(301, 20000, autotune=True) == N
+        assert measured == [(301, 20000), (301, 5000), (65, 5000)]
+    finally:
+        hsh_signal.signal._autotune_block_size = autotune
+        hsh_signal.signal._BLOCK_SIZE_CACHE_SIZE = cache_size
+        hsh_signal.signal._block_size_tuned.clear()
+
+
+def test_convolve_valid():
+    for ntaps, nsig in [(9, 100), (9, 50000), (2001, 3000), (2001, 50000), (301, 302)]:
+        x = np.random.randn(nsig)
+        taps = np.random.randn(ntaps).astype(np.float32)
+        assert np.allclose(convolve_valid(x, taps), np.convolve(x, taps, mode='valid'))
+    # signal shorter than the taps: no valid output (np.convolve() would swap the operands)
+    taps = np.ones(5, dtype=np.float32)
+    for nsig in [0, 1, 4]:
+        y = convolve_valid(np.ones(nsig), taps)
+        assert y.shape == (0,) and y.dtype == np.float64
+    assert np.array_equal(convolve_valid(np.ones(5), taps), [5.0])
+
+
+def test_fir_filter_modes():
+    taps = np.random.randn(501).astype(np.float32)
+    x = np.random.randn(30000)
+    outputs = []
+    for mode in [FIRFilter.MODE_CONVOLVE, FIRFilter.MODE_FFT_CONVOLVE, FIRFilter.MODE_AUTO]:
+        fir = FIRFilter(taps, None)
+        fir.mode = mode
+        outputs.append(np.concatenate([fir.batch(b) for b in np.split(x, [10, 700, 20000])]))
+    assert np.allclose(outputs[0], outputs[1])
+    assert np.allclose(outputs[0], outputs[2])
+
+
+def test_fir_filter_float32():
+    taps = np.random.randn(501).astype(np.float32)
+    x = np.random.randn(30000)
+    for mode in [FIRFilter.MODE_CONVOLVE, FIRFilter.MODE_FFT_CONVOLVE]:
+        fir = FIRFilter(taps, None)
+        fir.mode = mode
+        y = fir.batch(x.astype(np.float32))
+        assert y.dtype == np.float32
+        assert np.allclose(y, np.convolve(np.concatenate([np.zeros(500), x]), taps, mode='valid'), atol=1e-3)
+
+
+def test_decimator():
+    taps = np.random.randn(31).astype(np.float32)
+    x = np.random.randn(5000)
+    dec = Decimator(taps, 4, 4000, phase=3)
+    y = np.concatenate([dec.batch(b) for b in np.split(x, [1, 2, 10, 1001])])
+    y_ref = np.convolve(np.concatenate([np.zeros(30), x]), taps, mode='valid')[3::4]
+    assert np.allclose(y, y_ref)
+
+
+def test_empty_batches():
+    """a decimator fed less than its ratio emits empty batches, which the following filters pass on as empty"""
+    for mode in [FIRFilter.MODE_CONVOLVE, FIRFilter.MODE_FFT_CONVOLVE, FIRFilter.MODE_AUTO]:
+        fir = FIRFilter(np.ones(5, dtype=np.float32) / 5, None)
+        fir.mode = mode
+        assert fir.batch(np.zeros(0)).shape == (0,)
+    assert Hilbert().batch(np.zeros(0)).shape == (0,)
+    assert Decimator(np.ones(8, dtype=np.float32), 4, 1000.0).batch(np.zeros(0)).shape == (0,)
+
+    x = np.random.randn(3000)
+    def run(chunk_size):
+        decimator, fir = Decimator(np.random.RandomState(0).randn(31).astype(np.float32), 8, 8000.0), FIRFilter(np.ones(5, dtype=np.float32) / 5, 1000.0)
+        return np.concatenate([fir.batch(decimator.batch(x[i:i+chunk_size])) for i in range(0, len(x), chunk_size)])
+    y = run(len(x))
+    for chunk_size in [3, 7, 8, 9]:
+        assert np.allclose(run(chunk_size), y)
+
+
+def test_hilbert_pll():
+    """fused native Hilbert + PLL matches the separate blocks"""
+    fps = 48000
+    t = np.arange(fps // 2) / float(fps)
+    x = np.cos(2*np.pi*18.8e3*t + 2 * np.sin(2*np.pi*5*t))
+    hilbert, pll = Hilbert(), PLL(1500, 21000, 17000, fps)
+    y_ref = pll.batch(hilbert.batch(x))
+    fused = HilbertPLL(1500, 21000, 17000, fps)
+    y = np.concatenate([fused.batch(b) for b in np.split(x, [10, 700, 5000])])
+    assert fused.delay == hilbert.delay
+    assert np.allclose(y, y_ref, atol=1e-5)
+
+
+def test_am_demod():
+    """fused AM demodulator matches Hilbert -> PLL VCO -> multiply, across batch boundaries"""
+    fps = 48000
+    t = np.arange(fps // 2) / float(fps)
+    x = (1 + 0.5 * np.sin(2*np.pi*3*t)) * np.cos(2*np.pi*18.8e3*t + 2 * np.sin(2*np.pi*5*t))
+    hilbert, pll = Hilbert(), PLL(4000, 21000, 17000, fps)
+    analytic = hilbert.batch(x)
+    y_ref = -np.real(pll.batch_vco(analytic) * analytic)
+    demod = _AMDemod(4000, 21000, 17000, fps)
+    # copy, the demodulator reuses its output buffer
+    y = np.concatenate([demod.batch(b).copy() for b in np.split(x, [10, 40, 700, 5000, 5001])])
+    assert demod.delay == hilbert.delay
+    assert np.allclose(y, y_ref, atol=1e-5)
+
+
+def test_pll_threads():
+    """independent PLL blocks running concurrently in threads (the native loops release the GIL) match serial runs"""
+    fps = 48000
+    t = np.arange(fps) / float(fps)
+    signals = [np.cos(2*np.pi*18.8e3*t + k * np.sin(2*np.pi*(3+k)*t)) for k in range(4)]
+    makers = [lambda: HilbertPLL(1500, 21000, 17000, fps), lambda: HilbertPLL(1500, 21000, 17000, fps, am=True),
+              lambda: PLL(1500, 21000, 17000, fps), lambda: PLL(1500, 21000, 17000, fps)]
+    inputs = [x if i < 2 else Hilbert().batch(x) for i, x in enumerate(signals)]
+
+    def run(make, x):
+        pll = make()
+        return np.concatenate([pll.batch(x[i:i+1000]) for i in range(0, len(x), 1000)])
+    serial = [run(make, x) for make, x in zip(makers, inputs)]
+    for _ in range(3):
+        results = [None] * len(makers)
+        def worker(i):
+            results[i] = run(makers[i], inputs[i])
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(makers))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for y, y_ref in zip(results, serial):
+            assert np.array_equal(y, y_ref)
+
+
+def test_pll_output():
+    """PLL outputs are owned by the caller, unless the output buffer is reused on request"""
+    fps = 48000
+    t = np.arange(4000) / float(fps)
+    x = np.cos(2*np.pi*18.8e3*t).astype(np.float32)
+    for make in [lambda reuse: HilbertPLL(1500, 21000, 17000, fps, reuse_output=reuse),
+                 lambda reuse: PLL(1500, 21000, 17000, fps, reuse_output=reuse)]:
+        pll = make(False)
+        y0 = pll.batch(x[:2000])
+        y0_copy = y0.copy()
+        pll.batch(x[2000:])
+        assert y0.dtype == np.float32 and np.array_equal(y0, y0_copy)
+        pll = make(True)
+        y0 = pll.batch(x[:2000])
+        assert np.shares_memory(y0, pll.batch(x[2000:]))
+        # float64 chains: the output is cast into a reused buffer, with the same values
+        pll, pll_ref = make(True), make(False)
+        y0 = pll.batch(x[:2000].astype(np.float64))
+        assert y0.dtype == np.float64 and np.array_equal(y0, pll_ref.batch(x[:2000].astype(np.float64)))
+        y1 = pll.batch(x[2000:].astype(np.float64))
+        assert np.shares_memory(y0, y1) and np.array_equal(y1, pll_ref.batch(x[2000:].astype(np.float64)))
+
+
+def test_state():
+    """invalid states are rejected without touching the block, stateful blocks must implement get_state()"""
+    fps = 48000
+    x = np.cos(2*np.pi*18.8e3*np.arange(2000) / float(fps))
+    pll = HilbertPLL(1500, 21000, 17000, fps)
+    pll.batch(x[:1000])
+    state = pll.get_state()
+    other = {'phase': state['phase'] + 1.0, 'freq': state['freq'] + 0.1, 'history': state['history'] + 1.0}
+    for bad in [dict(other, history=other['history'][1:]), dict(other, freq=None), {'phase': other['phase']}]:
+        try:
+            pll.set_state(bad)
+            assert False, 'expected an error'
+        except (ValueError, TypeError, KeyError):
+            pass
+        after = pll.get_state()
+        assert after['phase'] == state['phase'] and after['freq'] == state['freq']
+        assert np.array_equal(after['history'], state['history'])
+
+    class Accumulator(FilterBlock):
+        def __init__(self):
+            super(Accumulator, self).__init__()
+            self.total = 0.0
+
+        def batch(self, x):
+            y = self.total + np.cumsum(x)
+            self.total = y[-1]
+            return y
+    try:
+        snapshot(Rescale(2.0), Accumulator())
+        assert False, 'expected NotImplementedError'
+    except NotImplementedError:
+        pass
+    restore(snapshot(Rescale(2.0), DataSink()), Rescale(2.0), DataSink())
+
+
+def test_delay():
+    x = np.random.randn(1000) + 1j * np.random.randn(1000)
+    delay = Delay(50)
+    y = np.concatenate([delay.batch(b) for b in np.split(x, [10, 30, 31, 500])])
+    assert np.array_equal(y, np.concatenate([np.zeros(50), x[:-50]]))
+    state = delay.get_state()
+    try:
+        delay.set_state({'buffer': np.zeros(49)})
+        assert False, 'expected ValueError'
+    except ValueError:
+        pass
+    delay.set_state(state)
+
+
+def test_data_sink():
+    x = np.random.randn(1000)
+    for expected_length in [None, 10, 1000]:
+        sink = DataSink(expected_length=expected_length)
+        for b in np.split(x, [10, 30, 31, 500]):
+            sink.put(b)
+        assert np.array_equal(sink.data, x)
+    sink.put(1j * x[:10])
+    assert np.array_equal(sink.view()[-10:], 1j * x[:10])
+    sink.reset()
+    assert len(sink.data) == 0
+    # the expected capacity is allocated on the first batch, in its dtype
+    sink = DataSink(expected_length=1000)
+    sink.put(x[:10].astype(np.float32))
+    assert sink.view().dtype == np.float32 and len(sink._buf) == 1000
+    # data can be replaced, and is appended to
+    sink.data = x[:5]
+    sink.put(x[5:10])
+    assert np.array_equal(sink.data, x[:10])
+
+
+def test_memmap_sink():
+    x = np.random.randn(1000)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        file_name = os.path.join(tmp_dir, 'out.npy')
+        sink = MemmapSink(file_name, chunk_size=64)
+        for b in np.split(x, [10, 30, 31, 500]):
+            sink.put(b)
+        assert np.array_equal(sink.data, x)
+        sink.put(x[:10])
+        sink.close()
+        data = np.load(file_name)
+        assert np.array_equal(data, np.concatenate([x, x[:10]]))
+        assert not MemmapSink.load(file_name).flags.writeable
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_pipeline():
+    x = np.random.randn(20000)
+    taps = [np.random.randn(n).astype(np.float32) for n in (31, 501, 7)]
+    sink = DataSink()
+    pipeline = Pipeline([FIRFilter(taps[0], None), [FIRFilter(taps[1], None), FIRFilter(taps[2], None)]], queue_size=2)
+    pipeline.connect(sink)
+    for b in np.split(x, 20):
+        pipeline.put(b)
+    pipeline.stop()
+    y_ref = x
+    for t in taps:
+        y_ref = np.convolve(np.concatenate([np.zeros(len(t) - 1), y_ref]), t, mode='valid')
+    assert np.allclose(sink.data, y_ref)
+
+    # a failing block is reported to the producer, and all worker threads still end
+    class FailingBlock(FIRFilter):
+        calls = 0
+
+        def batch(self, x):
+            self.calls += 1
+            if self.calls > 5:
+                raise ValueError('bad batch')
+            return super(FailingBlock, self).batch(x)
+    for failing_stage in [0, 1]:
+        stages = [FIRFilter(taps[0], None), FIRFilter(taps[1], None), FIRFilter(taps[2], None)]
+        stages[failing_stage] = FailingBlock(taps[failing_stage], None)
+        pipeline = Pipeline(stages)
+        pipeline.connect(DataSink())
+        errors = 0
+        try:
+            for b in np.split(x, 20):
+                pipeline.put(b)
+        except PipelineError:
+            errors += 1
+        threads = [stage._thread for stage in pipeline.stages]
+        try:
+            pipeline.stop()
+        except PipelineError:
+            errors += 1
+        assert errors > 0
+        assert all(thread is not None and not thread.is_alive() for thread in threads)
+
+
+def test_flowgraph():
+    x = np.random.randn(20000)
+    taps = np.random.randn(61).astype(np.float32)
+    calls = []
+
+    class CountingFIRFilter(FIRFilter):
+        def batch(self, x):
+            calls.append(len(x))
+            return super(CountingFIRFilter, self).batch(x)
+
+    # one filter feeding a sink and a downsampling branch
+    fir, full, down = CountingFIRFilter(taps, None), DataSink(), DataSink()
+    downsampler = Downsampler(3)
+    graph = Flowgraph()
+    graph.connect(fir, full)
+    graph.connect(fir, downsampler, down)
+    assert graph.latency(full) == 30 and graph.latency(down) == 10 and graph.ratio(down) == 3
+    graph.run(x, batch_size=5000)
+    assert len(calls) == 5  # shared upstream block runs once per batch
+    y = apply_filter(x, FIRFilter(taps, None))
+    assert np.allclose(full.data, y)
+    assert np.array_equal(down.data, full.data[::3])
+
+    class PushComposite(SourceBlock):
+        """composite that only works via put(), through connect()ed stages"""
+        def __init__(self):
+            super(PushComposite, self).__init__()
+            self.stages = [FIRFilter(taps, None), FIRFilter(taps, None)]
+            self.delay = 60
+            connect(*self.stages)
+
+        def connect(self, consumer):
+            self.stages[-1].connect(consumer)
+
+        def put(self, x):
+            self.stages[0].put(x)
+
+    # apply_filter() pushes through put(), and flowgraphs reject blocks that bypass batch()
+    y = apply_filter(x, FIRFilter(taps, None))
+    assert np.allclose(apply_filter(x, PushComposite())[30:-30], apply_filter(y, FIRFilter(taps, None))[30:-30])
+    assert np.array_equal(apply_filter(x, RegroupBatches(1000)), x)
+    assert np.array_equal(RegroupBatches(1000).batch(x), x)
+
+    class DelayOnlyFilter(object):
+        """filter object that is not a FilterBlock: no latency(), only a delay"""
+        delay, sampling_rate = 30, None
+
+        def __init__(self):
+            self.fir = FIRFilter(taps, None)
+
+        def connect(self, consumer):
+            self.fir.connect(consumer)
+
+        def put(self, x):
+            self.fir.put(x)
+    assert np.array_equal(apply_filter(x, DelayOnlyFilter()), y)
+    for bad in [PushComposite(), RegroupBatches(1000), Splitter()]:
+        graph = Flowgraph()
+        graph.connect(bad, DataSink())
+        try:
+            graph.validate()
+            assert False, 'expected FlowgraphError'
+        except FlowgraphError:
+            pass
+
+    for edges in [[(fir, fir, full)], [(fir, full), (downsampler, full)], [(fir, downsampler)], [(fir, full, downsampler, down)]]:
+        graph = Flowgraph()
+        for chain in edges:
+            graph.connect(*chain)
+        try:
+            graph.validate()
+            assert False, 'expected FlowgraphError'
+        except FlowgraphError:
+            pass
+
+
+def test_profiler():
+    x = np.random.randn(20000)
+    fir, decimator, sink = FIRFilter(np.random.randn(31).astype(np.float32), 1000.0), Decimator(np.ones(8, dtype=np.float32), 4, 1000.0), DataSink()
+    graph = Flowgraph()
+    graph.connect(fir, decimator, sink)
+    profiler = Profiler(graph)
+    graph.put(x[:5000])
+    with profiler:
+        for b in np.split(x[5000:], 3):
+            graph.put(b)
+    graph.put(x[:5000])
+    assert 'batch' not in fir.__dict__  # disabled again
+    stats = profiler.stats()
+    assert stats['Flowgraph/FIRFilter']['calls'] == 3 and stats['Flowgraph/FIRFilter']['samples_in'] == 15000
+    assert stats['Flowgraph/Decimator']['samples_out'] == 3750
+    assert stats['Flowgraph/Decimator']['realtime_factor'] > 0
+    assert 'Flowgraph/DataSink' not in stats
+    assert len(profiler.chrome_trace()['traceEvents']) == 6
+    assert 'Flowgraph/FIRFilter' in profiler.report()
+
+    # nested profilers: disabling one restores the wrapper of the other, not the class method
+    outer, inner = Profiler(fir), Profiler(fir)
+    with outer:
+        with inner:
+            fir.batch(x[:1000])
+        fir.batch(x[:1000])
+    assert 'batch' not in fir.__dict__
+    assert outer.stats()['FIRFilter']['calls'] == 2 and inner.stats()['FIRFilter']['calls'] == 1
+
+    # blocks run in the worker threads of a pipeline, one trace track per thread
+    fir, decimator, sink = FIRFilter(np.random.randn(31).astype(np.float32), 1000.0), Decimator(np.ones(8, dtype=np.float32), 4, 1000.0), DataSink()
+    pipeline = Pipeline([fir, decimator])
+    pipeline.connect(sink)
+    with Profiler(pipeline) as profiler:
+        with pipeline:
+            for b in np.split(x, 4):
+                pipeline.put(b)
+    stats = profiler.stats()
+    assert stats['Pipeline/ThreadedStage/FIRFilter']['samples_in'] == 20000
+    assert stats['Pipeline/ThreadedStage#2/Decimator']['samples_out'] == 5000
+    tids = dict((e['name'], e['tid']) for e in profiler.chrome_trace()['traceEvents'])
+    assert len(tids) == 2 and len(set(tids.values())) == 2
+    assert get_ident() not in tids.values()
+
+
+def test_taps_spectrum_cached():
+    taps = np.random.randn(301).astype(np.float32)
+    H = taps_spectrum(taps, 2048)
+    assert taps_spectrum(taps.copy(), 2048) is H
+    assert taps_spectrum(taps, 4096) is not H
+    # a filter keeps only the spectrum of its current FFT size, however the batch lengths vary
+    fir = FIRFilter(taps, None)
+    fir.mode = FIRFilter.MODE_FFT_CONVOLVE
+    x = np.random.randn(20000)
+    y = np.concatenate([fir.batch(x[i:j]) for i, j in zip([0, 1000, 3000, 8000], [1000, 3000, 8000, 20000])])
+    assert len(fir._spectra) == 1
+    assert np.allclose(y, np.convolve(np.concatenate([np.zeros(300), x]), taps, mode='valid'))
+
+
+if __name__ == '__main__':
+    test_filter_fft_ff()
+    test_filter_fft_cc()
+    test_filter_fft_block_boundaries()
+    test_filter_fft_batched()
+    test_fft_block_size()
+    test_convolve_valid()
+    test_fir_filter_modes()
+    test_fir_filter_float32()
+    test_decimator()
+    test_empty_batches()
+    test_hilbert_pll()
+    test_am_demod()
+    test_pll_threads()
+    test_pll_output()
+    test_state()
+    test_delay()
+    test_data_sink()
+    test_memmap_sink()
+    test_pipeline()
+    test_flowgraph()
+    test_profiler()
+    test_taps_spectrum_cached()
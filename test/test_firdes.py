@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from gr_firdes import cache, firdes
+
+
+def test_cache_hit():
+    cache.clear_cache()
+    taps = cache.low_pass_2(1, 1000, 100, 20, 60)
+    assert np.array_equal(taps, firdes.low_pass_2(1, 1000, 100, 20, 60))
+    assert cache.low_pass_2(1, 1000, 100, 20, 60) is taps  # hit
+    assert cache.low_pass_2(1, 1000, 110, 20, 60) is not taps  # miss: different spec
+
+    # LRU eviction
+    cache_size = cache.CACHE_SIZE
+    try:
+        cache.CACHE_SIZE = 2
+        cache.low_pass_2(1, 1000, 120, 20, 60)
+        cache.low_pass_2(1, 1000, 130, 20, 60)
+        assert cache.low_pass_2(1, 1000, 100, 20, 60) is not taps
+    finally:
+        cache.CACHE_SIZE = cache_size
+
+
+def test_cache_read_only():
+    taps = cache.hilbert(65)
+    try:
+        taps[0] = 1.0
+        assert False, 'expected the cached taps to be read-only'
+    except ValueError:
+        pass
+
+
+def test_cache_disk_store():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        cache_dir = os.path.join(tmp_dir, 'not', 'yet', 'there')
+        cache.set_cache_dir(cache_dir)
+        cache.clear_cache()
+        taps = cache.band_pass_2(1, 48000, 17000, 21000, 500, 60)
+        assert len(os.listdir(cache_dir)) == 1
+        cache.clear_cache()
+        taps_loaded = cache.band_pass_2(1, 48000, 17000, 21000, 500, 60)
+        assert taps_loaded is not taps and np.array_equal(taps_loaded, taps)
+
+        # a failing store still returns the design
+        shutil.rmtree(cache_dir)
+        cache.clear_cache()
+        assert np.array_equal(cache.band_pass_2(1, 48000, 17000, 21000, 500, 60), taps)
+    finally:
+        cache.set_cache_dir(None)
+        cache.clear_cache()
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    test_cache_hit()
+    test_cache_read_only()
+    test_cache_disk_store()
@@ -0,0 +1,50 @@
+import sys
+
+import numpy as np
+import pytest
+
+from hsh_signal.filter import FIRFilter, DataSink
+from hsh_signal.flowgraph import Flowgraph
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='hsh_signal.live requires Python 3.7')
+def test_async_runner():
+    """concurrent streams through flowgraphs, with awaitable and plain sinks"""
+    import asyncio
+    from hsh_signal.live import AsyncRunner, QueueSource, ReplaySource, QueueSink
+
+    taps = np.random.randn(31).astype(np.float32)
+    signals = [np.random.randn(5000) for _ in range(3)]
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        feed = QueueSource()
+        for i in range(0, len(signals[2]), 900):
+            feed.write_nowait(signals[2][i:i+900])
+        feed.write_nowait(None)
+        sources = [ReplaySource(signals[0], 700, sampling_rate=1e6), ReplaySource(signals[1], 1000, realtime=False), feed]
+        runners, sinks = [], []
+        for source in sources:
+            queue_sink, data_sink = QueueSink(), DataSink()
+            graph = Flowgraph()
+            graph.connect(FIRFilter(taps, None), queue_sink)
+            graph.connect(graph.source, data_sink)
+            runners.append(AsyncRunner(source, graph))
+            sinks.append((queue_sink, data_sink))
+        loop.run_until_complete(asyncio.gather(*[runner.run() for runner in runners]))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    for sig, (queue_sink, data_sink) in zip(signals, sinks):
+        batches = [queue_sink.get_nowait()]
+        while batches[-1] is not None:
+            batches.append(queue_sink.get_nowait())
+        y = np.concatenate(batches[:-1])
+        y_ref = np.convolve(sig, taps, mode='full')[15:len(sig)]  # trimmed latency of 15 samples
+        assert np.allclose(y, y_ref)
+        assert np.array_equal(data_sink.data, y)
+
+
+if __name__ == '__main__':
+    test_async_runner()